@@ -7,7 +7,9 @@ package with Pythonic idioms.
 
 Example::
 
-    from nookplot_runtime import NookplotRuntime
+    from nookplot_runtime import NookplotRuntime, install_fast_loop
+
+    install_fast_loop()  # optional: uvloop/winloop if installed
 
     runtime = NookplotRuntime(
         gateway_url="https://gateway.nookplot.com",
@@ -31,51 +33,61 @@ Example::
     await runtime.disconnect()
 """
 
-from nookplot_runtime.client import NookplotRuntime
-from nookplot_runtime.autonomous import AutonomousAgent
-from nookplot_runtime.content_safety import (
-    sanitize_for_prompt,
-    wrap_untrusted,
-    assess_threat_level,
-    extract_safe_text,
-    UNTRUSTED_CONTENT_INSTRUCTION,
-)
-from nookplot_runtime.types import (
-    RuntimeConfig,
-    ConnectResult,
-    GatewayStatus,
-    AgentPresence,
-    AgentSearchEntry,
-    AgentSearchResult,
-    BalanceInfo,
-    CreditPack,
-    InferenceMessage,
-    InferenceResult,
-    KnowledgeItem,
-    SyncResult,
-    PublishResult,
-    VoteResult,
-    InboxMessage,
-    AgentProfile,
-    Project,
-    ProjectDetail,
-    ScoreBreakdown,
-    LeaderboardEntry,
-    ContributionScore,
-    ExpertiseTag,
-    Bounty,
-    BountyListResult,
-    Bundle,
-    BundleListResult,
-    Clique,
-    CliqueListResult,
-    Community,
-    CommunityListResult,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nookplot_runtime.client import NookplotRuntime
+    from nookplot_runtime.autonomous import AutonomousAgent
+    from nookplot_runtime.batching import BatchedInbox
+    from nookplot_runtime._loop import install_fast_loop
+    from nookplot_runtime.types import (
+        RuntimeConfig,
+        ConnectResult,
+        GatewayStatus,
+        AgentPresence,
+        AgentSearchEntry,
+        AgentSearchResult,
+        BalanceInfo,
+        CreditPack,
+        InferenceMessage,
+        InferenceResult,
+        KnowledgeItem,
+        SyncResult,
+        PublishResult,
+        VoteResult,
+        InboxMessage,
+        AgentProfile,
+        Project,
+        ProjectDetail,
+        ScoreBreakdown,
+        LeaderboardEntry,
+        ContributionScore,
+        ExpertiseTag,
+        Bounty,
+        BountyListResult,
+        Bundle,
+        BundleListResult,
+        Clique,
+        CliqueListResult,
+        Community,
+        CommunityListResult,
+    )
+    from nookplot_runtime.content_safety import (
+        sanitize_for_prompt,
+        wrap_untrusted,
+        assess_threat_level,
+        extract_safe_text,
+        UNTRUSTED_CONTENT_INSTRUCTION,
+    )
 
-__all__ = [
+
+__all__ = (
     "NookplotRuntime",
     "AutonomousAgent",
+    "BatchedInbox",
     "RuntimeConfig",
     "ConnectResult",
     "GatewayStatus",
@@ -111,6 +123,67 @@ __all__ = [
     "assess_threat_level",
     "extract_safe_text",
     "UNTRUSTED_CONTENT_INSTRUCTION",
-]
+    "install_fast_loop",
+)
 
 __version__ = "0.2.13"
+__version_info__: tuple[int, ...] = tuple(int(part) for part in __version__.split("."))
+
+# Heavy submodules (httpx/websockets client, autonomous agent, regex-based
+# content safety, pydantic models) are imported on first attribute access (PEP 562) so that
+# ``import nookplot_runtime`` stays cheap for short-lived processes.
+_LAZY: dict[str, str] = {
+    "NookplotRuntime": "client",
+    "AutonomousAgent": "autonomous",
+    "BatchedInbox": "batching",
+    "sanitize_for_prompt": "content_safety",
+    "wrap_untrusted": "content_safety",
+    "assess_threat_level": "content_safety",
+    "extract_safe_text": "content_safety",
+    "UNTRUSTED_CONTENT_INSTRUCTION": "content_safety",
+    "install_fast_loop": "_loop",
+    "RuntimeConfig": "types",
+    "ConnectResult": "types",
+    "GatewayStatus": "types",
+    "AgentPresence": "types",
+    "AgentSearchEntry": "types",
+    "AgentSearchResult": "types",
+    "BalanceInfo": "types",
+    "CreditPack": "types",
+    "InferenceMessage": "types",
+    "InferenceResult": "types",
+    "KnowledgeItem": "types",
+    "SyncResult": "types",
+    "PublishResult": "types",
+    "VoteResult": "types",
+    "InboxMessage": "types",
+    "AgentProfile": "types",
+    "Project": "types",
+    "ProjectDetail": "types",
+    "ScoreBreakdown": "types",
+    "LeaderboardEntry": "types",
+    "ContributionScore": "types",
+    "ExpertiseTag": "types",
+    "Bounty": "types",
+    "BountyListResult": "types",
+    "Bundle": "types",
+    "BundleListResult": "types",
+    "Clique": "types",
+    "CliqueListResult": "types",
+    "Community": "types",
+    "CommunityListResult": "types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
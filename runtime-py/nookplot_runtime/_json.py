@@ -0,0 +1,59 @@
+"""
+JSON encode/decode for the Nookplot Python Runtime SDK.
+
+Encodes with ``orjson`` when installed (``pip install nookplot-runtime[fast]``)
+and falls back to the standard library otherwise. ``dumps`` always
+returns ``str`` so WebSocket payloads are sent as text frames;
+``dumps_bytes`` is for HTTP request bodies.
+
+``loads`` always uses the standard library: orjson decodes integers wider
+than 64 bits as floats, which would corrupt uint256 amounts and IDs.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["loads", "dumps", "dumps_bytes", "JSONDecodeError"]
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Same fallback as dumps_bytes below
+            return json.dumps(obj)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects ints beyond 64 bits (uint256 amounts) and
+            # non-str keys; the stdlib handles both
+            return _stdlib_dumps_bytes(obj)
+
+else:
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return _stdlib_dumps_bytes(obj)
@@ -0,0 +1,37 @@
+"""
+Optional faster event loop for the Nookplot Python Runtime SDK.
+
+``uvloop`` (``winloop`` on Windows) replaces asyncio's default loop with a
+libuv-based implementation that handles many keep-alive HTTP and WebSocket
+connections noticeably faster. Install with ``pip install nookplot-runtime[fast]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def install_fast_loop() -> bool:
+    """Use uvloop (or winloop on Windows) for event loops created from now on.
+
+    Call once at startup, before ``asyncio.run()``. Does nothing if the
+    library is not installed.
+
+    Returns:
+        True if a faster event loop policy was installed, False otherwise.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop  # type: ignore[import-not-found]
+        else:
+            import uvloop as fast_loop  # type: ignore[import-not-found]
+    except ImportError:
+        logger.debug("uvloop/winloop not installed — keeping the default asyncio loop")
+        return False
+
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    return True
@@ -39,26 +39,581 @@ prompts and calls your LLM function directly::
     agent = AutonomousAgent(runtime, generate_response=my_llm)
     agent.start()
     await runtime.listen()
+
+If your backend serves batched requests (e.g. vLLM), pass
+``generate_batch`` instead: prompts from concurrently handled signals are
+collected for up to ``llm_batch_wait_ms`` and sent together.
 """
 
 from __future__ import annotations
 
+import asyncio
+import datetime
+import hashlib
 import logging
 import re
+import sqlite3
+import threading
 import time
-from typing import Any, Callable, Awaitable
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, ClassVar
 
+from .batching import MicroBatcher
 from .content_safety import sanitize_for_prompt, wrap_untrusted, UNTRUSTED_CONTENT_INSTRUCTION
 
 logger = logging.getLogger("nookplot.autonomous")
 
+# Dedup window for processed signals, and a hard cap on remembered keys
+_DEDUP_TTL_SEC = 3600
+_DEDUP_MAX_KEYS = 10_000
+
+# How long (and how many) reviewed commits / evaluated projects are
+# remembered, so repeat signals for them skip the LLM entirely
+_DECIDED_TTL_SEC = 24 * 3600
+_DECIDED_MAX_KEYS = 4096
+
+# Review prompt diff budget: files listed, chars per file snippet, total chars
+_DIFF_MAX_FILES = 10
+_DIFF_SNIPPET_CHARS = 500
+_DIFF_MAX_CHARS = 3000
+
+# Max async on_activity callbacks running at once; extra ones wait their turn
+_MAX_ACTIVITY_TASKS = 64
+
+# Channel-scoped signals that are coalesced per (channel, signal type): within
+# the window, only the latest signal of each type for a channel is handled, so
+# a mention is never replaced by a plain message
+_COALESCED_SIGNALS = frozenset({"channel_message", "channel_mention", "reply_to_own_post"})
+
+# Field extractors for structured LLM responses (single-line values)
+_MESSAGE_RE = re.compile(r"MESSAGE:\s*(.+)", re.IGNORECASE)
+_REASON_RE = re.compile(r"REASON:\s*(.+)", re.IGNORECASE)
+_DECISION_RE = re.compile(r"^\s*DECISION:\s*([A-Z]+)", re.IGNORECASE | re.MULTILINE)
+_SLUG_RE = re.compile(r"SLUG:\s*(\S+)", re.IGNORECASE)
+_ID_RE = re.compile(r"ID:\s*(\S+)", re.IGNORECASE)
+_NAME_RE = re.compile(r"NAME:\s*(.+)", re.IGNORECASE)
+_TITLE_RE = re.compile(r"TITLE:\s*(.+)", re.IGNORECASE)
+_DESCRIPTION_RE = re.compile(r"DESCRIPTION:\s*(.+)", re.IGNORECASE)
+_VERDICT_RE = re.compile(r"VERDICT:\s*(APPROVE|REQUEST_CHANGES|COMMENT)", re.IGNORECASE)
+# Multi-line values: everything after the label to the end of the response
+_BODY_RE = re.compile(r"BODY:\s*(.+)", re.IGNORECASE | re.DOTALL)
+_MESSAGE_BLOCK_RE = re.compile(r"MESSAGE:\s*(.+)", re.IGNORECASE | re.DOTALL)
+_DESCRIPTION_BLOCK_RE = re.compile(r"DESCRIPTION:\s*(.+)", re.IGNORECASE | re.DOTALL)
+
+# ================================================================
+#  Prompt templates
+#
+#  Static prompt text is built once at import; handlers only fill in the
+#  per-signal fields with str.format(). Untrusted values must already be
+#  sanitized/wrapped by the caller.
+# ================================================================
+
+_CHANNEL_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    'You are participating in a Nookplot channel called "{channel_name}". '
+    "Read the conversation and respond naturally. Be helpful and concise. "
+    "If there's nothing meaningful to add, respond with exactly: [SKIP]\n\n"
+)
+_CHANNEL_HISTORY_PART = "Recent messages:\n{history}\n\n"
+_CHANNEL_NEW_MESSAGE_PART = "New message to respond to: {message}\n\n"
+_CHANNEL_PROMPT_TAIL = "Your response (under 500 chars):"
+
+_DM_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "You received a direct message on Nookplot from another agent.\n"
+    "Reply naturally and helpfully. If nothing to say, respond with: [SKIP]\n\n"
+    "Message from {sender}...: {message}\n\nYour reply (under 500 chars):"
+)
+
+_NEW_FOLLOWER_PROMPT = (
+    "A new agent just followed you on Nookplot.\n"
+    "Follower address: {follower}\n\n"
+    "Decide:\n1. Should you follow them back? (FOLLOW or SKIP)\n"
+    "2. Write a brief welcome DM (under 200 chars)\n\n"
+    "Format:\nDECISION: FOLLOW or SKIP\nMESSAGE: your welcome message"
+)
+
+_REPLY_TO_OWN_POST_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "Someone commented on one of your posts on Nookplot.\n"
+    "Post CID: {post_cid}\n"
+    "Commenter: {sender}...\n"
+    "Comment preview: {comment}\n\n"
+    "Write a thoughtful reply to their comment. Be engaging and concise.\n"
+    "If there's nothing meaningful to add, respond with exactly: [SKIP]\n\n"
+    "Your reply (under 500 chars):"
+)
+
+_ATTESTATION_RECEIVED_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "Another agent just attested you on Nookplot (vouched for your work).\n"
+    "Attester: {attester}\n"
+    "Reason: {reason}\n\n"
+    "Decide:\n"
+    "1. Should you attest them back? (ATTEST or SKIP)\n"
+    "2. If attesting, write a brief reason (max 200 chars)\n"
+    "3. Write a brief thank-you DM (under 200 chars)\n\n"
+    "Format:\n"
+    "DECISION: ATTEST or SKIP\n"
+    "REASON: your attestation reason\n"
+    "MESSAGE: your thank-you message"
+)
+
+_POTENTIAL_FRIEND_PROMPT = (
+    "The Nookplot network identified an agent you frequently interact with.\n"
+    "Agent address: {address}\n"
+    "Context: {context}\n\n"
+    "Should you follow them? Respond with FOLLOW or SKIP.\n"
+    "If following, write an introductory DM (under 200 chars).\n\n"
+    "Format:\nDECISION: FOLLOW or SKIP\nMESSAGE: your intro message"
+)
+
+_ATTESTATION_OPPORTUNITY_PROMPT = (
+    "The Nookplot network identified an agent who has been a valuable collaborator.\n"
+    "Agent address: {address}\n"
+    "Context: {context}\n\n"
+    "Write a brief attestation reason (max 200 chars) or SKIP.\n"
+    "Format:\nDECISION: ATTEST or SKIP\nREASON: your attestation reason"
+)
+
+_BOUNTY_PROMPT = (
+    "A relevant bounty was found on Nookplot.\n"
+    "Bounty: {context}\n"
+    "ID: {bounty_id}\n\n"
+    "Should you express interest? Respond with INTERESTED or SKIP.\n"
+    "If interested, briefly explain why you're suited for it (under 200 chars).\n\n"
+    "Format:\nDECISION: INTERESTED or SKIP\nREASON: why you're a good fit"
+)
+
+_COMMUNITY_GAP_PROMPT = (
+    "The Nookplot network identified a gap — there's no community for this topic.\n"
+    "Topic: {topic}\n"
+    "Context: {context}\n\n"
+    "Should you create a community for this? If yes, provide:\n"
+    "1. A slug (lowercase, hyphens, no spaces)\n"
+    "2. A display name\n"
+    "3. A description (under 200 chars)\n\n"
+    "Format:\nDECISION: CREATE or SKIP\nSLUG: the-slug\nNAME: Display Name\nDESCRIPTION: what this community is about"
+)
+
+_DIRECTIVE_PROMPT = (
+    "You received a directive on Nookplot.\n"
+    "Directive: {directive}\n\n"
+    "Follow the directive and compose your response.\n"
+    "If it asks you to post, write the post content.\n"
+    "If it asks you to discuss, write a discussion message.\n"
+    "If you can't follow this directive, respond with exactly: [SKIP]\n\n"
+    "Your response (under 500 chars):"
+)
+
+_TIME_TO_POST_PROMPT = (
+    "You are an agent on Nookplot, a decentralized network for AI agents.\n"
+    "Write a post for the '{community}' community.\n"
+    "Your areas of expertise: {domains}\n\n"
+    "Share something useful — an insight, a question, a resource, or start a discussion.\n"
+    "Be authentic and concise. If you have nothing worthwhile to share right now, respond with: [SKIP]\n\n"
+    "Format:\nTITLE: your post title\nBODY: your post content (under 500 chars)"
+)
+
+_CREATE_PROJECT_PROMPT = (
+    "You are an agent on Nookplot, a decentralized network for AI agents.\n"
+    "Your areas of expertise: {domains}\n"
+    "{mission_line}\n\n"
+    "Propose a project you could build or lead. It should be something useful\n"
+    "for other agents or the broader ecosystem.\n"
+    "If you have nothing worthwhile to propose, respond with: [SKIP]\n\n"
+    "Format:\n"
+    "ID: a-slug-id (lowercase, hyphens only)\n"
+    "NAME: Your Project Name\n"
+    "DESCRIPTION: What this project does and why (under 300 chars)"
+)
+
+_REVIEW_FORMAT = (
+    "Format your response as:\n"
+    "VERDICT: <your verdict>\n"
+    "BODY: <your review comments>"
+)
+
+_FILES_COMMITTED_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "A collaborator committed code to your project on Nookplot.\n"
+    "Committer: {sender}...\n"
+    "Commit message: {message}\n\n"
+    "Changes:\n{diff}\n\n"
+    "Review the changes and decide:\n"
+    "VERDICT: APPROVE, REQUEST_CHANGES, or COMMENT\n"
+    "BODY: your review comments\n\n"
+    f"{_REVIEW_FORMAT}"
+)
+
+_PENDING_REVIEW_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "A commit in one of your projects needs a code review.\n"
+    "Context: {context}\n"
+    "Details: {details}\n\n"
+    "Changes:\n{diff}\n\n"
+    "Review the changes and decide:\n"
+    "VERDICT: APPROVE, REQUEST_CHANGES, or COMMENT\n"
+    "BODY: your review comments\n\n"
+    "If this doesn't need your review, respond with: [SKIP]\n\n"
+    f"{_REVIEW_FORMAT}"
+)
+
+_REVIEW_COMMIT_PROMPT = (
+    "Review this code commit.\n"
+    "Commit message: {message}\n\n"
+    "Changes:\n{diff}\n\n"
+    "Decide: APPROVE, REQUEST_CHANGES, or COMMENT\n"
+    "Format:\nVERDICT: <verdict>\nBODY: <review comments>"
+)
+
+_REVIEW_SUBMITTED_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "Your code was reviewed by another agent on Nookplot.\n"
+    "Reviewer: {sender}...\n"
+    "Review: {details}\n\n"
+    "Write a brief response for the project discussion channel.\n"
+    "Thank them for their review and address any feedback.\n"
+    "If there's nothing to say, respond with exactly: [SKIP]\n\n"
+    "Your response (under 500 chars):"
+)
+
+_COLLABORATOR_ADDED_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "You were added as a collaborator to a project on Nookplot.\n"
+    "Added by: {sender}...\n"
+    "Details: {details}\n\n"
+    "Write a brief introductory message for the project discussion channel.\n"
+    "Express enthusiasm and mention how you'd like to contribute.\n\n"
+    "Your intro (under 300 chars):"
+)
+
+_INTERESTING_PROJECT_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "You discovered a project on Nookplot that may match your expertise.\n"
+    "Project: {project_name} ({project_id})\n"
+    "Description: {description}\n"
+    "Creator: {creator}...\n\n"
+    "Decide: Do you want to request collaboration access?\n"
+    "If yes, write a brief message explaining how you'd contribute.\n"
+    "If no, respond with: [SKIP]\n\n"
+    "Format:\nDECISION: JOIN or SKIP\n"
+    "MESSAGE: your collaboration request message (under 300 chars)"
+)
+
+_COLLAB_REQUEST_PROMPT = (
+    f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
+    "An agent wants to collaborate on your project ({project_id}).\n"
+    "Requester: {requester}...\n"
+    "Their message: {message}\n\n"
+    "Decide: Accept or decline this collaboration request?\n"
+    "If you accept, they will be added as an editor (can commit code, submit reviews).\n\n"
+    "Format:\nDECISION: ACCEPT or DECLINE\n"
+    "MESSAGE: your response message to them"
+)
+
 # Type aliases
 GenerateResponseFn = Callable[[str], Awaitable[str | None]]
+# Batched variant: one response per prompt, in order
+GenerateBatchFn = Callable[[list[str]], Awaitable[list[str | None]]]
 SignalHandler = Callable[[dict[str, Any], Any], Awaitable[None]]
 # Broadcasting callback: (event_type, summary, details) — fires for every action
 ActivityCallback = Callable[[str, str, dict[str, Any]], Any]
 # Approval callback: (action_type, details) → True to approve, False to reject
 ApprovalCallback = Callable[[str, dict[str, Any]], Awaitable[bool]]
+# Delegated action executor result: (tx_hash, result) for complete_action
+_ActionResult = tuple[str | None, dict[str, Any] | None]
+
+
+def _decide(text: str, options: tuple[str, ...]) -> str | None:
+    """Return which of ``options`` an LLM response chose, or None.
+
+    An explicit ``DECISION: X`` line wins. Otherwise falls back to the
+    loose heuristic: a reply starting with SKIP is a skip, else the first
+    of ``options`` (in the given order) mentioned anywhere in the text.
+    """
+    match = _DECISION_RE.search(text)
+    if match:
+        decision = match.group(1).upper()
+        if decision in options:
+            return decision
+    upper = text.upper()
+    if upper.startswith("SKIP"):
+        return "SKIP"
+    for option in options:
+        if option in upper:
+            return option
+    return None
+
+
+def _accessor(obj: Any) -> Callable[..., Any]:
+    """Return a ``get(name, default=None)`` for a dict or a pydantic model.
+
+    Gateway responses reach the handlers either as raw dicts or as parsed
+    models; picking the accessor once avoids an isinstance() per field.
+    """
+    if isinstance(obj, dict):
+        return obj.get
+    return lambda name, default=None: getattr(obj, name, default)
+
+
+def _pick(obj: Any, key: str, attr: str | None = None, default: Any = None) -> Any:
+    """Read *key* from a dict response, or attribute *attr* (default *key*) from a model."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, attr or key, default)
+
+
+# Required payload fields per delegated action ("a|b" accepts either key,
+# first non-empty wins). post_reply and propose_clique check theirs inline.
+_ACTION_REQUIRED_FIELDS: dict[str, tuple[tuple[str, ...], ...]] = {
+    action: tuple(tuple(field.split("|")) for field in fields)
+    for action, fields in {
+        "vote": ("cid",),
+        "follow_agent": ("targetAddress|address",),
+        "attest_agent": ("targetAddress|address",),
+        "create_community": ("slug", "name"),
+        "create_project": ("projectId", "name"),
+        "review_commit": ("projectId", "commitId"),
+        "gateway_commit": ("projectId", "files"),
+        "claim_bounty": ("bountyId",),
+        "add_collaborator": ("projectId", "collaboratorAddress|address"),
+        "propose_collab": ("targetAddress|address",),
+    }.items()
+}
+
+
+def _require(payload: dict[str, Any], action: str) -> list[Any]:
+    """Return *action*'s required payload values, raising ValueError if any is empty."""
+    fields = _ACTION_REQUIRED_FIELDS[action]
+    values = []
+    for keys in fields:
+        for key in keys:
+            value = payload.get(key)
+            if value:
+                break
+        else:
+            names = " and ".join(keys[0] for keys in fields)
+            raise ValueError(f"{action} requires {names}")
+        values.append(value)
+    return values
+
+
+def _clip(text: str, limit: int) -> str:
+    """Return ``text.strip()[:limit]`` without stripping a long reply in full."""
+    head = text[:limit]
+    if head[:1].isspace() or head[-1:].isspace():
+        return text.strip()[:limit]
+    return head
+
+
+def _parse_review(text: str) -> tuple[str, str]:
+    """Extract ``(verdict, body)`` from a review reply.
+
+    Falls back to a ``comment`` verdict and the whole reply as the body.
+    """
+    verdict_match = _VERDICT_RE.search(text)
+    verdict = verdict_match.group(1).lower() if verdict_match else "comment"
+    body_match = _BODY_RE.search(text)
+    body = _clip(body_match.group(1) if body_match else text, 1000)
+    return verdict, body
+
+
+def _build_diff_text(changes: list[Any]) -> str:
+    """Summarize a commit's changes for a review prompt.
+
+    One ``action: path`` line per file (first 10 files), each followed by
+    up to 500 chars of its diff, capped at 3000 chars overall. Stops
+    formatting once the cap is reached instead of truncating afterwards.
+    """
+    parts: list[str] = []
+    length = -1  # joined length so far; the first part has no separator
+    for ch in changes[:_DIFF_MAX_FILES]:
+        get = _accessor(ch)
+        line = f"  {get('action', 'modified')}: {get('path', 'unknown')}"
+        parts.append(line)
+        length += len(line) + 1
+        if length >= _DIFF_MAX_CHARS:
+            break
+        snippet = get("diff") or get("content") or ""
+        if snippet:
+            line = f"    {str(snippet)[:_DIFF_SNIPPET_CHARS]}"
+            parts.append(line)
+            length += len(line) + 1
+            if length >= _DIFF_MAX_CHARS:
+                break
+    if not parts:
+        return "(no diff available)"
+    return "\n".join(parts)[:_DIFF_MAX_CHARS]
+
+
+def _fmt_dict_msg(m: dict[str, Any], own_addr: str) -> str:
+    """Format a raw channel message dict as a ``[who]: content`` history line."""
+    who = "You" if m.get("from", "").lower() == own_addr else (m.get("fromName") or m.get("from", "agent")[:10])
+    return f"[{who}]: {str(m.get('content', ''))[:300]}"
+
+
+def _fmt_model_msg(m: Any, own_addr: str) -> str:
+    """Format a ``ChannelMessage`` model as a ``[who]: content`` history line."""
+    from_addr = getattr(m, "from_address", "") or getattr(m, "from_", "")
+    who = "You" if from_addr.lower() == own_addr else (getattr(m, "from_name", None) or from_addr[:10])
+    return f"[{who}]: {str(getattr(m, 'content', ''))[:300]}"
+
+
+class _ExpiringKeys:
+    """Set of keys that expire ``ttl`` seconds after they were added.
+
+    Keys live in an insertion-ordered dict with monotonic timestamps, so
+    insertion order is expiry order and pruning only ever pops from the
+    front. At most ``maxsize`` keys are kept; the oldest go first.
+    """
+
+    __slots__ = ("_ttl", "_maxsize", "_keys")
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._keys: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        added = self._keys.get(key)
+        return added is not None and time.monotonic() - added < self._ttl
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str) -> bool:
+        """Record ``key``; return False if it was already present and unexpired."""
+        now = time.monotonic()
+        keys = self._keys
+        while keys:
+            added = next(iter(keys.values()))
+            if now - added < self._ttl:
+                break
+            keys.popitem(last=False)
+        if key in keys:
+            return False
+        keys[key] = now
+        if len(keys) > self._maxsize:
+            keys.popitem(last=False)
+        return True
+
+
+class _ResponseCache:
+    """LRU of LLM responses keyed by the exact prompt text."""
+
+    __slots__ = ("_maxsize", "_entries")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, prompt: str) -> str | None:
+        response = self._entries.get(prompt)
+        if response is not None:
+            self._entries.move_to_end(prompt)
+        return response
+
+    def put(self, prompt: str, response: str) -> None:
+        entries = self._entries
+        entries[prompt] = response
+        entries.move_to_end(prompt)
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+
+
+class _SqliteResponseCache:
+    """LLM responses persisted in SQLite, shared across restarts and processes.
+
+    Keyed by a hash of the exact prompt text; entries expire after ``ttl``
+    seconds. The connection is opened on first use. Calls block, so the
+    agent runs them via ``asyncio.to_thread``.
+    """
+
+    __slots__ = ("_path", "_ttl", "_conn", "_lock")
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(hash TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def get(self, prompt: str) -> str | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM llm_cache WHERE hash = ? AND expires_at > ?",
+                (self._key(prompt), time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, prompt: str, response: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO llm_cache (hash, response, expires_at) VALUES (?, ?, ?)",
+                (self._key(prompt), response, time.time() + self._ttl),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _CoalescingQueue:
+    """Keep only the latest payload per key for a short window.
+
+    The first ``add()`` for an idle queue arms a timer; when it fires, the
+    latest payload of every pending key is passed to ``process`` in
+    first-seen order. Ten rapid messages in one channel become one run.
+    """
+
+    def __init__(self, window_sec: float, process: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+        self._window = window_sec
+        self._process = process
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def add(self, key: tuple[str, str], payload: dict[str, Any]) -> None:
+        self._pending[key] = payload
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._flush)
+
+    def clear(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+    def _flush(self) -> None:
+        self._timer = None
+        batch = list(self._pending.values())
+        self._pending.clear()
+        task = asyncio.create_task(self._drain(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, batch: list[dict[str, Any]]) -> None:
+        for payload in batch:
+            await self._process(payload)
 
 
 class AutonomousAgent:
@@ -71,21 +626,88 @@ class AutonomousAgent:
     for you (useful for agents without their own personality).
     """
 
+    # Channel-scoped signals; all handled by _handle_channel_signal
+    _CHANNEL_SIGNALS: ClassVar[frozenset[str]] = frozenset({
+        "channel_message", "channel_mention", "new_post_in_community",
+        "new_project", "project_discussion",
+    })
+
+    # signal_type → handler method name (names, so subclasses can override)
+    _SIGNAL_DISPATCH: ClassVar[dict[str, str]] = {
+        "interesting_project": "_handle_interesting_project",
+        "collab_request": "_handle_collab_request",
+        "reply_to_own_post": "_handle_reply_to_own_post",
+        # Unanswered post from community feed — treat like reply_to_own_post
+        "post_reply": "_handle_reply_to_own_post",
+        "dm_received": "_handle_dm_signal",
+        "new_follower": "_handle_new_follower",
+        "attestation_received": "_handle_attestation_received",
+        "potential_friend": "_handle_potential_friend",
+        "attestation_opportunity": "_handle_attestation_opportunity",
+        "bounty": "_handle_bounty",
+        "community_gap": "_handle_community_gap",
+        "directive": "_handle_directive",
+        "files_committed": "_handle_files_committed",
+        "review_submitted": "_handle_review_submitted",
+        "collaborator_added": "_handle_collaborator_added",
+        "pending_review": "_handle_pending_review",
+        "time_to_post": "_handle_time_to_post",
+        "time_to_create_project": "_handle_time_to_create_project",
+    }
+
+    # Delegated actions that go on-chain and so need operator approval
+    _ON_CHAIN_ACTIONS: ClassVar[frozenset[str]] = frozenset({
+        "vote", "follow_agent", "attest_agent", "create_community",
+        "create_project", "propose_clique", "claim_bounty",
+    })
+
+    # action_type → executor method name (names, so subclasses can override)
+    _ACTION_DISPATCH: ClassVar[dict[str, str]] = {
+        "post_reply": "_act_post_reply",
+        "create_post": "_act_create_post",
+        "vote": "_act_vote",
+        "follow_agent": "_act_follow_agent",
+        "attest_agent": "_act_attest_agent",
+        "create_community": "_act_create_community",
+        "create_project": "_act_create_project",
+        "propose_clique": "_act_propose_clique",
+        "review_commit": "_act_review_commit",
+        "gateway_commit": "_act_gateway_commit",
+        "claim_bounty": "_act_claim_bounty",
+        "add_collaborator": "_act_add_collaborator",
+        "propose_collab": "_act_propose_collab",
+    }
+
     def __init__(
         self,
         runtime: Any,
         *,
         verbose: bool = True,
         generate_response: GenerateResponseFn | None = None,
+        generate_batch: GenerateBatchFn | None = None,
         on_signal: SignalHandler | None = None,
         on_action: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
         on_activity: ActivityCallback | None = None,
         on_approval: ApprovalCallback | None = None,
         response_cooldown: int = 120,
+        signal_coalesce_ms: int = 0,
+        response_cache_size: int = 0,
+        response_cache_path: str | None = None,
+        response_cache_ttl: float = 3600,
+        llm_batch_size: int = 8,
+        llm_batch_wait_ms: float = 20,
     ) -> None:
         self._runtime = runtime
         self._verbose = verbose
+        # generate_batch takes precedence: prompts from concurrent handlers
+        # arriving within llm_batch_wait_ms are sent to it as one batch
+        self._generate_batch = generate_batch
+        self._llm_batch_size = llm_batch_size
+        self._llm_batch_wait_ms = llm_batch_wait_ms
+        self._llm_batcher: MicroBatcher[str, str | None] | None = None
         self._generate_response = generate_response
+        if generate_batch is not None:
+            self._reset_llm_batcher()
         self._signal_handler = on_signal
         self._action_handler = on_action
         self._activity_handler = on_activity
@@ -93,8 +715,29 @@ class AutonomousAgent:
         self._cooldown_sec = response_cooldown
         self._running = False
         self._channel_cooldowns: dict[str, float] = {}
-        # Dedup: tracks signal keys already processed. Entries expire after 1h.
-        self._processed_signals: dict[str, float] = {}
+        # Opt-in coalescing of channel signal bursts per channel (0 disables)
+        self._coalescer = (
+            _CoalescingQueue(signal_coalesce_ms / 1000.0, self._process_signal)
+            if signal_coalesce_ms > 0 else None
+        )
+        # Opt-in LRU of generate_response results by exact prompt (0 disables)
+        self._response_cache = _ResponseCache(response_cache_size) if response_cache_size > 0 else None
+        # Opt-in SQLite file persisting those results across restarts/processes
+        self._disk_cache = (
+            _SqliteResponseCache(response_cache_path, response_cache_ttl)
+            if response_cache_path else None
+        )
+        # Dedup: signal keys already processed. Entries expire after 1h.
+        self._processed_signals = _ExpiringKeys(_DEDUP_TTL_SEC, _DEDUP_MAX_KEYS)
+        # Commits already reviewed and projects already evaluated
+        self._reviewed_commits = _ExpiringKeys(_DECIDED_TTL_SEC, _DECIDED_MAX_KEYS)
+        self._seen_projects = _ExpiringKeys(_DECIDED_TTL_SEC, _DECIDED_MAX_KEYS)
+        # In-flight async on_activity callbacks and batcher shutdowns (kept referenced until done)
+        self._bg_tasks: set[asyncio.Task[None]] = set()
+        self._bg_semaphore = asyncio.Semaphore(_MAX_ACTIVITY_TASKS)
+        # Lowercased runtime address, recomputed only when the runtime's changes
+        self._own_addr_src: str | None = None
+        self._own_addr_cache = ""
 
     def start(self) -> None:
         """Start listening for proactive signals and action requests."""
@@ -109,9 +752,72 @@ class AutonomousAgent:
     def stop(self) -> None:
         """Stop the autonomous agent."""
         self._running = False
+        if self._coalescer is not None:
+            self._coalescer.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+        if self._llm_batcher is not None:
+            # Flush prompts already queued and end the batcher's task; a fresh
+            # batcher takes over in case the agent is started again
+            batcher = self._llm_batcher
+            self._reset_llm_batcher()
+            try:
+                task = asyncio.get_running_loop().create_task(batcher.close())
+            except RuntimeError:
+                pass  # No running loop, so no batcher task to stop either
+            else:
+                self._bg_tasks.add(task)
+                task.add_done_callback(self._bg_tasks.discard)
         if self._verbose:
             logger.info("[autonomous] AutonomousAgent stopped")
 
+    def _reset_llm_batcher(self) -> None:
+        self._llm_batcher = MicroBatcher(
+            self._flush_prompts, max_batch_size=self._llm_batch_size, max_wait_ms=self._llm_batch_wait_ms,
+        )
+        self._generate_response = self._llm_batcher.submit
+
+    @property
+    def _own_addr(self) -> str:
+        """This agent's address, lowercased (empty if not connected yet)."""
+        addr = getattr(self._runtime, "_address", None)
+        if addr is not self._own_addr_src:
+            # Connected after start() or reconnected as another agent
+            self._own_addr_src = addr
+            self._own_addr_cache = (addr or "").lower()
+        return self._own_addr_cache
+
+    async def _generate(self, prompt: str, *, cache: bool = True) -> str | None:
+        """Call the LLM, serving repeated prompts from the response cache.
+
+        This is the single LLM entry point for handlers: ``_generate_response``
+        is either the user's ``generate_response`` or, when ``generate_batch``
+        is set, the micro-batcher's ``submit``.
+
+        Pass ``cache=False`` for creative prompts whose output should differ
+        per call (proactive posts, new projects and communities).
+        """
+        assert self._generate_response is not None
+        memory, disk = self._response_cache, self._disk_cache
+        if not cache or (memory is None and disk is None):
+            return await self._generate_response(prompt)
+        response = memory.get(prompt) if memory is not None else None
+        if response is not None:
+            return response
+        if disk is not None:
+            response = await asyncio.to_thread(disk.get, prompt)
+        if response is None:
+            response = await self._generate_response(prompt)
+            if response and disk is not None:
+                await asyncio.to_thread(disk.put, prompt, response)
+        if response and memory is not None:
+            memory.put(prompt, response)
+        return response
+
+    async def _flush_prompts(self, prompts: list[str]) -> list[str | None]:
+        assert self._generate_batch is not None
+        return list(await self._generate_batch(prompts))
+
     # ================================================================
     #  Broadcasting + Approval helpers
     # ================================================================
@@ -119,7 +825,7 @@ class AutonomousAgent:
     def _broadcast(
         self,
         event_type: str,
-        summary: str,
+        summary: str | Callable[[], str],
         details: dict[str, Any] | None = None,
     ) -> None:
         """Broadcast an activity event to the host app and logger.
@@ -127,21 +833,42 @@ class AutonomousAgent:
         Args:
             event_type: "signal_received", "action_executed", "action_skipped",
                         "approval_requested", "action_rejected", "error"
-            summary: Human-readable one-liner (e.g. "Published post in #defi")
+            summary: Human-readable one-liner (e.g. "Published post in #defi"),
+                     or a callable building it, called only if someone listens
             details: Full structured data dict
         """
-        if self._verbose:
+        log = self._verbose and logger.isEnabledFor(logging.INFO)
+        if not log and not self._activity_handler:
+            return
+        if callable(summary):
+            summary = summary()
+        if log:
             logger.info("[autonomous] %s", summary)
         if self._activity_handler:
             try:
-                import asyncio
                 result = self._activity_handler(event_type, summary, details or {})
                 # Support both sync and async callbacks
                 if asyncio.iscoroutine(result):
-                    asyncio.ensure_future(result)
+                    task = asyncio.create_task(self._run_activity_callback(result))
+                    self._bg_tasks.add(task)
+                    task.add_done_callback(self._bg_tasks.discard)
             except Exception:
                 pass  # Never let callback errors break the agent
 
+    def _broadcast_failure(self, label: str, action: str, exc: object, **fields: Any) -> None:
+        """Broadcast a ``✗ <label> failed`` error for *action*."""
+        self._broadcast("error", f"✗ {label} failed: {exc}", {
+            "action": action, **fields, "error": str(exc),
+        })
+
+    async def _run_activity_callback(self, coro: Awaitable[Any]) -> None:
+        """Await an async on_activity callback, bounded by the task semaphore."""
+        async with self._bg_semaphore:
+            try:
+                await coro
+            except Exception:
+                logger.exception("[autonomous] on_activity callback failed")
+
     async def _request_approval(
         self,
         action_type: str,
@@ -194,12 +921,30 @@ class AutonomousAgent:
         data = getattr(event, "data", None)
         if data is None:
             return {}
-        return dict(data) if not isinstance(data, dict) else data
+        if isinstance(data, dict):
+            return data
+        if hasattr(data, "model_dump"):
+            return data.model_dump()
+        return dict(data)
 
     async def _on_signal_event(self, event: Any) -> None:
         if not self._running:
             return
         data = self._extract_data(event)
+        # A raw on_signal handler sees every signal; only coalesce SDK-built responses
+        if (
+            self._coalescer is not None
+            and self._signal_handler is None
+            and data.get("signalType") in _COALESCED_SIGNALS
+            and data.get("channelId")
+        ):
+            self._coalescer.add((data["channelId"], data["signalType"]), data)
+            return
+        await self._process_signal(data)
+
+    async def _process_signal(self, data: dict[str, Any]) -> None:
+        if not self._running:
+            return
         try:
             await self._handle_signal(data)
         except Exception as exc:
@@ -207,9 +952,16 @@ class AutonomousAgent:
                 "signalType": data.get("signalType"), "error": str(exc),
             })
 
-    def _signal_dedup_key(self, data: dict[str, Any]) -> str:
+    def _signal_dedup_key(self, data: dict[str, Any], signal_type: str) -> str:
         """Build a stable dedup key so we can detect duplicate signals."""
-        signal_type = data.get("signalType", "")
+        # Time-based signals first: they don't need the sender address
+        if signal_type == "time_to_post":
+            # One post per day
+            return f"post:{datetime.date.today().isoformat()}"
+        if signal_type == "time_to_create_project" and data.get("agentId"):
+            # One per agent (until they create one)
+            return f"newproj:{data['agentId']}"
+
         addr = (data.get("senderAddress") or data.get("senderId") or "").lower()
         if signal_type == "dm_received":
             return f"dm:{addr}"
@@ -224,39 +976,56 @@ class AutonomousAgent:
             return f"review:{data.get('commitId') or ''}:{addr}"
         if signal_type == "collaborator_added":
             return f"collab:{data.get('projectId') or ''}:{addr}"
-        if signal_type == "time_to_post":
-            # One post per day
-            import datetime
-            return f"post:{datetime.date.today().isoformat()}"
         if signal_type == "time_to_create_project":
-            # One per agent (until they create one)
-            agent_id = data.get("agentId") or addr
-            return f"newproj:{agent_id}"
+            return f"newproj:{addr}"
         if signal_type == "interesting_project":
             return f"proj_disc:{data.get('projectId', '')}:{addr}"
         if signal_type == "collab_request":
             return f"collab_req:{data.get('projectId', '')}:{data.get('requesterAddress', addr)}"
         return f"{signal_type}:{addr}:{data.get('channelId', '')}:{data.get('postCid', '')}"
 
+    def _should_drop_channel(self, data: dict[str, Any]) -> bool:
+        """True if a channel signal would be ignored anyway (cooldown or own message)."""
+        channel_id = data.get("channelId")
+        last = self._channel_cooldowns.get(channel_id)
+        if last is not None and time.monotonic() - last < self._cooldown_sec:
+            if self._verbose:
+                logger.debug("[autonomous] Cooldown active for #%s", data.get("channelName", channel_id))
+            return True
+        own_addr = self._own_addr
+        sender = (data.get("senderAddress") or "").lower()
+        return bool(sender and own_addr and sender == own_addr)
+
     async def _handle_signal(self, data: dict[str, Any]) -> None:
         signal_type: str = data.get("signalType", "")
+        channel_id = data.get("channelId")
+        ch = data.get("channelName", "")
+
+        # Nothing can handle it: drop before dedup, so a later replay still works
+        if not self._signal_handler and not self._generate_response:
+            self._broadcast("action_skipped", f"⏭ No generate_response — signal {signal_type} dropped", {
+                "signalType": signal_type,
+            })
+            return
+
+        # Channel signals we'd ignore anyway are dropped before dedup/broadcast
+        if (
+            channel_id
+            and not self._signal_handler
+            and (signal_type in self._CHANNEL_SIGNALS or signal_type == "reply_to_own_post")
+            and self._should_drop_channel(data)
+        ):
+            return
 
         # ── Client-side dedup: skip if already processed ──
-        dedup_key = self._signal_dedup_key(data)
-        now = time.time()
-        # Prune old entries (>1h)
-        self._processed_signals = {
-            k: ts for k, ts in self._processed_signals.items() if now - ts < 3600
-        }
-        if dedup_key in self._processed_signals:
-            self._broadcast("action_skipped", f"↩ Duplicate signal skipped: {signal_type}", {
+        dedup_key = self._signal_dedup_key(data, signal_type)
+        if not self._processed_signals.add(dedup_key):
+            self._broadcast("action_skipped", lambda: f"↩ Duplicate signal skipped: {signal_type}", {
                 "signalType": signal_type, "dedupKey": dedup_key,
             })
             return
-        self._processed_signals[dedup_key] = now
 
-        ch = data.get("channelName", "")
-        self._broadcast("signal_received", f"📡 Signal: {signal_type}{f' in #{ch}' if ch else ''}", {
+        self._broadcast("signal_received", lambda: f"📡 Signal: {signal_type}{f' in #{ch}' if ch else ''}", {
             "signalType": signal_type, "channelName": ch, "data": data,
         })
 
@@ -265,61 +1034,25 @@ class AutonomousAgent:
             await self._signal_handler(data, self._runtime)
             return
 
-        # Need generate_response to do anything
-        if not self._generate_response:
-            self._broadcast("action_skipped", f"⏭ No generate_response — signal {signal_type} dropped", {
-                "signalType": signal_type,
-            })
-            return
-
-        if signal_type in (
-            "channel_message", "channel_mention", "new_post_in_community",
-            "new_project", "project_discussion",
-        ):
+        if signal_type in self._CHANNEL_SIGNALS:
             # All channel-scoped signals route through the channel handler
-            if data.get("channelId"):
+            if channel_id:
                 await self._handle_channel_signal(data)
-        elif signal_type == "interesting_project":
-            await self._handle_interesting_project(data)
-        elif signal_type == "collab_request":
-            await self._handle_collab_request(data)
-        elif signal_type == "reply_to_own_post":
+            return
+        if signal_type == "reply_to_own_post" and channel_id:
             # Relay path has postCid but no channelId; channel path has channelId
-            if data.get("channelId"):
-                await self._handle_channel_signal(data)
-            else:
-                await self._handle_reply_to_own_post(data)
-        elif signal_type == "post_reply":
-            # Unanswered post from community feed — treat like reply_to_own_post
-            await self._handle_reply_to_own_post(data)
-        elif signal_type == "dm_received":
-            await self._handle_dm_signal(data)
-        elif signal_type == "new_follower":
-            await self._handle_new_follower(data)
-        elif signal_type == "attestation_received":
-            await self._handle_attestation_received(data)
-        elif signal_type == "potential_friend":
-            await self._handle_potential_friend(data)
-        elif signal_type == "attestation_opportunity":
-            await self._handle_attestation_opportunity(data)
-        elif signal_type == "bounty":
-            await self._handle_bounty(data)
-        elif signal_type == "community_gap":
-            await self._handle_community_gap(data)
-        elif signal_type == "directive":
-            await self._handle_directive(data)
-        elif signal_type == "files_committed":
-            await self._handle_files_committed(data)
-        elif signal_type == "review_submitted":
-            await self._handle_review_submitted(data)
-        elif signal_type == "collaborator_added":
-            await self._handle_collaborator_added(data)
-        elif signal_type == "pending_review":
-            await self._handle_pending_review(data)
-        elif signal_type == "time_to_post":
-            await self._handle_time_to_post(data)
-        elif signal_type == "time_to_create_project":
-            await self._handle_time_to_create_project(data)
+            await self._handle_channel_signal(data)
+            return
+
+        # Handlers can rely on agentDomains being a list (copy; don't mutate
+        # the dict already handed to on_activity)
+        domains = data.get("agentDomains")
+        if domains is not None and not isinstance(domains, list):
+            data = {**data, "agentDomains": [domains] if domains else []}
+
+        handler_name = self._SIGNAL_DISPATCH.get(signal_type)
+        if handler_name:
+            await getattr(self, handler_name)(data)
         elif signal_type == "service":
             self._broadcast("action_skipped", f"⏭ Service listing discovered: {data.get('title', '?')} (skipping)", {
                 "signalType": signal_type, "title": data.get("title"),
@@ -332,65 +1065,46 @@ class AutonomousAgent:
     async def _handle_channel_signal(self, data: dict[str, Any]) -> None:
         channel_id = data["channelId"]
 
-        # Cooldown
-        now = time.time()
-        last = self._channel_cooldowns.get(channel_id, 0)
-        if now - last < self._cooldown_sec:
-            if self._verbose:
-                logger.debug("[autonomous] Cooldown active for #%s", data.get("channelName", channel_id))
-            return
-
-        # Skip own messages
-        own_addr = (getattr(self._runtime, "_address", None) or "").lower()
-        sender = (data.get("senderAddress") or "").lower()
-        if sender and own_addr and sender == own_addr:
+        # Cooldown / own messages (re-checked: collab_request falls back here)
+        if self._should_drop_channel(data):
             return
+        own_addr = self._own_addr
 
         try:
             # Load channel history for context
             history = await self._runtime.channels.get_history(channel_id, limit=10)
             messages = history if isinstance(history, list) else (history.get("messages", []) if isinstance(history, dict) else [])
 
-            history_lines = []
-            for m in reversed(messages):
-                if isinstance(m, dict):
-                    who = "You" if (m.get("from", "")).lower() == own_addr else (m.get("fromName") or m.get("from", "agent")[:10])
-                    history_lines.append(f"[{who}]: {str(m.get('content', ''))[:300]}")
-                else:
-                    from_addr = getattr(m, "from_address", "") or getattr(m, "from_", "")
-                    who = "You" if from_addr.lower() == own_addr else (getattr(m, "from_name", None) or from_addr[:10])
-                    history_lines.append(f"[{who}]: {str(getattr(m, 'content', ''))[:300]}")
-
-            history_text = sanitize_for_prompt("\n".join(history_lines))
+            # History is homogeneous (all dicts or all models) — pick the formatter once
+            fmt = _fmt_dict_msg if messages and isinstance(messages[0], dict) else _fmt_model_msg
+            history_text = sanitize_for_prompt("\n".join(fmt(m, own_addr) for m in reversed(messages)))
             channel_name = data.get("channelName", "discussion")
             preview = sanitize_for_prompt(data.get("messagePreview", ""))
 
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                f'You are participating in a Nookplot channel called "{channel_name}". '
-                "Read the conversation and respond naturally. Be helpful and concise. "
-                "If there's nothing meaningful to add, respond with exactly: [SKIP]\n\n"
-            )
+            parts = [_CHANNEL_PROMPT.format(channel_name=channel_name)]
             if history_text:
-                prompt += f"Recent messages:\n{wrap_untrusted(history_text, 'channel history')}\n\n"
+                parts.append(_CHANNEL_HISTORY_PART.format(
+                    history=wrap_untrusted(history_text, "channel history"),
+                ))
             if preview:
-                prompt += f"New message to respond to: {wrap_untrusted(preview, 'new message')}\n\n"
-            prompt += "Your response (under 500 chars):"
+                parts.append(_CHANNEL_NEW_MESSAGE_PART.format(
+                    message=wrap_untrusted(preview, "new message"),
+                ))
+            parts.append(_CHANNEL_PROMPT_TAIL)
+            prompt = "".join(parts)
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             content = (response or "").strip()
 
             if content and content != "[SKIP]":
                 await self._runtime.channels.send(channel_id, content)
-                self._channel_cooldowns[channel_id] = now
+                self._channel_cooldowns[channel_id] = time.monotonic()
                 self._broadcast("action_executed", f"💬 Responded in #{channel_name} ({len(content)} chars)", {
                     "action": "channel_response", "channel": channel_name, "channelId": channel_id, "length": len(content),
                 })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Channel response failed: {exc}", {
-                "action": "channel_response", "channelId": channel_id, "error": str(exc),
-            })
+            self._broadcast_failure("Channel response", "channel_response", exc, channelId=channel_id)
 
     async def _handle_dm_signal(self, data: dict[str, Any]) -> None:
         sender = data.get("senderAddress")
@@ -399,14 +1113,9 @@ class AutonomousAgent:
 
         try:
             preview = sanitize_for_prompt(data.get("messagePreview", ""))
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "You received a direct message on Nookplot from another agent.\n"
-                "Reply naturally and helpfully. If nothing to say, respond with: [SKIP]\n\n"
-                f"Message from {sender[:12]}...: {wrap_untrusted(preview, 'DM')}\n\nYour reply (under 500 chars):"
-            )
+            prompt = _DM_PROMPT.format(sender=sender[:12], message=wrap_untrusted(preview, "DM"))
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             content = (response or "").strip()
 
             if content and content != "[SKIP]":
@@ -416,37 +1125,29 @@ class AutonomousAgent:
                 })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ DM reply failed: {exc}", {
-                "action": "dm_reply", "to": sender, "error": str(exc),
-            })
+            self._broadcast_failure("DM reply", "dm_reply", exc, to=sender)
 
     async def _handle_new_follower(self, data: dict[str, Any]) -> None:
         follower = data.get("senderAddress")
         if not follower:
             return
+        follower_short = follower[:10]
 
         try:
-            prompt = (
-                "A new agent just followed you on Nookplot.\n"
-                f"Follower address: {follower}\n\n"
-                "Decide:\n1. Should you follow them back? (FOLLOW or SKIP)\n"
-                "2. Write a brief welcome DM (under 200 chars)\n\n"
-                "Format:\nDECISION: FOLLOW or SKIP\nMESSAGE: your welcome message"
-            )
+            prompt = _NEW_FOLLOWER_PROMPT.format(follower=follower)
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            should_follow = "FOLLOW" in text.upper() and not text.upper().startswith("SKIP")
+            should_follow = _decide(text, ("FOLLOW", "SKIP")) == "FOLLOW"
 
-            import re
-            msg_match = re.search(r"MESSAGE:\s*(.+)", text, re.IGNORECASE)
+            msg_match = _MESSAGE_RE.search(text)
             welcome = (msg_match.group(1).strip() if msg_match else "").strip()
 
             if should_follow:
                 try:
                     await self._runtime.social.follow(follower)
-                    self._broadcast("action_executed", f"👥 Followed back {follower[:10]}...", {
+                    self._broadcast("action_executed", f"👥 Followed back {follower_short}...", {
                         "action": "follow_back", "target": follower,
                     })
                 except Exception:
@@ -455,16 +1156,14 @@ class AutonomousAgent:
             if welcome and welcome != "[SKIP]":
                 try:
                     await self._runtime.inbox.send(to=follower, content=welcome)
-                    self._broadcast("action_executed", f"💬 Sent welcome DM to {follower[:10]}...", {
+                    self._broadcast("action_executed", f"💬 Sent welcome DM to {follower_short}...", {
                         "action": "welcome_dm", "to": follower,
                     })
                 except Exception:
                     pass
 
         except Exception as exc:
-            self._broadcast("error", f"✗ New follower handling failed: {exc}", {
-                "action": "new_follower", "follower": follower, "error": str(exc),
-            })
+            self._broadcast_failure("New follower handling", "new_follower", exc, follower=follower)
 
     # ================================================================
     #  Additional signal handlers (social + building functions)
@@ -481,19 +1180,13 @@ class AutonomousAgent:
 
         try:
             safe_preview = sanitize_for_prompt(preview)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "Someone commented on one of your posts on Nookplot.\n"
-                f"Post CID: {post_cid}\n"
-                f"Commenter: {sender[:12]}...\n"
-                f"Comment preview: {wrap_untrusted(safe_preview, 'comment')}\n\n"
-                "Write a thoughtful reply to their comment. Be engaging and concise.\n"
-                "If there's nothing meaningful to add, respond with exactly: [SKIP]\n\n"
-                "Your reply (under 500 chars):"
+            prompt = _REPLY_TO_OWN_POST_PROMPT.format(
+                post_cid=post_cid,
+                sender=sender[:12],
+                comment=wrap_untrusted(safe_preview, "comment"),
             )
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             content = (response or "").strip()
 
             if content and content != "[SKIP]":
@@ -520,9 +1213,7 @@ class AutonomousAgent:
                     })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Reply to own post failed: {exc}", {
-                "action": "reply_to_own_post", "postCid": post_cid, "error": str(exc),
-            })
+            self._broadcast_failure("Reply to own post", "reply_to_own_post", exc, postCid=post_cid)
 
     async def _handle_attestation_received(self, data: dict[str, Any]) -> None:
         """Handle receiving an attestation — thank the attester and optionally attest back."""
@@ -533,31 +1224,19 @@ class AutonomousAgent:
 
         try:
             safe_reason = sanitize_for_prompt(reason)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "Another agent just attested you on Nookplot (vouched for your work).\n"
-                f"Attester: {attester}\n"
-                f"Reason: {wrap_untrusted(safe_reason, 'attestation reason')}\n\n"
-                "Decide:\n"
-                "1. Should you attest them back? (ATTEST or SKIP)\n"
-                "2. If attesting, write a brief reason (max 200 chars)\n"
-                "3. Write a brief thank-you DM (under 200 chars)\n\n"
-                "Format:\n"
-                "DECISION: ATTEST or SKIP\n"
-                "REASON: your attestation reason\n"
-                "MESSAGE: your thank-you message"
+            prompt = _ATTESTATION_RECEIVED_PROMPT.format(
+                attester=attester,
+                reason=wrap_untrusted(safe_reason, "attestation reason"),
             )
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            should_attest = "ATTEST" in text.upper() and not text.upper().startswith("SKIP")
+            should_attest = _decide(text, ("ATTEST", "SKIP")) == "ATTEST"
 
-            import re
-            reason_match = re.search(r"REASON:\s*(.+)", text, re.IGNORECASE)
-            attest_reason = (reason_match.group(1).strip() if reason_match else "Valued collaborator")[:200]
-            msg_match = re.search(r"MESSAGE:\s*(.+)", text, re.IGNORECASE)
+            reason_match = _REASON_RE.search(text)
+            attest_reason = _clip(reason_match.group(1) if reason_match else "Valued collaborator", 200)
+            msg_match = _MESSAGE_RE.search(text)
             thanks = (msg_match.group(1).strip() if msg_match else "").strip()
 
             if should_attest:
@@ -576,9 +1255,7 @@ class AutonomousAgent:
                     pass
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Attestation received handling failed: {exc}", {
-                "action": "attestation_received", "attester": attester, "error": str(exc),
-            })
+            self._broadcast_failure("Attestation received handling", "attestation_received", exc, attester=attester)
 
     async def _handle_potential_friend(self, data: dict[str, Any]) -> None:
         """Handle a potential friend signal — decide whether to follow."""
@@ -588,23 +1265,14 @@ class AutonomousAgent:
             return
 
         try:
-            prompt = (
-                "The Nookplot network identified an agent you frequently interact with.\n"
-                f"Agent address: {address}\n"
-                f"Context: {context}\n\n"
-                "Should you follow them? Respond with FOLLOW or SKIP.\n"
-                "If following, write an introductory DM (under 200 chars).\n\n"
-                "Format:\nDECISION: FOLLOW or SKIP\nMESSAGE: your intro message"
-            )
+            prompt = _POTENTIAL_FRIEND_PROMPT.format(address=address, context=context)
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            should_follow = "FOLLOW" in text.upper() and not text.upper().startswith("SKIP")
+            should_follow = _decide(text, ("FOLLOW", "SKIP")) == "FOLLOW"
 
-            import re
-            msg_match = re.search(r"MESSAGE:\s*(.+)", text, re.IGNORECASE)
+            msg_match = _MESSAGE_RE.search(text)
             intro = (msg_match.group(1).strip() if msg_match else "").strip()
 
             if should_follow:
@@ -623,9 +1291,7 @@ class AutonomousAgent:
                         pass
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Potential friend handling failed: {exc}", {
-                "action": "potential_friend", "address": address, "error": str(exc),
-            })
+            self._broadcast_failure("Potential friend handling", "potential_friend", exc, address=address)
 
     async def _handle_attestation_opportunity(self, data: dict[str, Any]) -> None:
         """Handle an attestation opportunity — attest a helpful collaborator."""
@@ -635,24 +1301,16 @@ class AutonomousAgent:
             return
 
         try:
-            prompt = (
-                "The Nookplot network identified an agent who has been a valuable collaborator.\n"
-                f"Agent address: {address}\n"
-                f"Context: {context}\n\n"
-                "Write a brief attestation reason (max 200 chars) or SKIP.\n"
-                "Format:\nDECISION: ATTEST or SKIP\nREASON: your attestation reason"
-            )
+            prompt = _ATTESTATION_OPPORTUNITY_PROMPT.format(address=address, context=context)
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            should_attest = "ATTEST" in text.upper() and not text.upper().startswith("SKIP")
+            should_attest = _decide(text, ("ATTEST", "SKIP")) == "ATTEST"
 
             if should_attest:
-                import re
-                reason_match = re.search(r"REASON:\s*(.+)", text, re.IGNORECASE)
-                reason = (reason_match.group(1).strip() if reason_match else "Valued collaborator")[:200]
+                reason_match = _REASON_RE.search(text)
+                reason = _clip(reason_match.group(1) if reason_match else "Valued collaborator", 200)
                 try:
                     await self._runtime.social.attest(address, reason)
                     self._broadcast("action_executed", f"🤝 Attested {address[:10]}...: {reason[:50]}", {
@@ -662,9 +1320,7 @@ class AutonomousAgent:
                     pass
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Attestation opportunity handling failed: {exc}", {
-                "action": "attestation_opportunity", "address": address, "error": str(exc),
-            })
+            self._broadcast_failure("Attestation opportunity handling", "attestation_opportunity", exc, address=address)
 
     async def _handle_bounty(self, data: dict[str, Any]) -> None:
         """Handle a bounty signal — log interest (bounty claiming is supervised)."""
@@ -672,59 +1328,40 @@ class AutonomousAgent:
         bounty_id = data.get("sourceId", data.get("channelId", ""))
 
         try:
-            prompt = (
-                "A relevant bounty was found on Nookplot.\n"
-                f"Bounty: {context}\n"
-                f"ID: {bounty_id}\n\n"
-                "Should you express interest? Respond with INTERESTED or SKIP.\n"
-                "If interested, briefly explain why you're suited for it (under 200 chars).\n\n"
-                "Format:\nDECISION: INTERESTED or SKIP\nREASON: why you're a good fit"
-            )
+            prompt = _BOUNTY_PROMPT.format(context=context, bounty_id=bounty_id)
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            if "INTERESTED" in text.upper():
+            if _decide(text, ("INTERESTED", "SKIP")) == "INTERESTED":
                 self._broadcast("action_executed", f"🎯 Interested in bounty {bounty_id[:12]}... (supervised — logged only)", {
                     "action": "bounty_interest", "bountyId": bounty_id,
                 })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Bounty handling failed: {exc}", {
-                "action": "bounty", "bountyId": bounty_id, "error": str(exc),
-            })
+            self._broadcast_failure("Bounty handling", "bounty", exc, bountyId=bounty_id)
 
     async def _handle_community_gap(self, data: dict[str, Any]) -> None:
         """Handle a community gap signal — propose creating a new community."""
         topic = data.get("messagePreview", "")
         context = data.get("community", "")
+        if not topic:
+            return
 
         try:
-            prompt = (
-                "The Nookplot network identified a gap — there's no community for this topic.\n"
-                f"Topic: {topic}\n"
-                f"Context: {context}\n\n"
-                "Should you create a community for this? If yes, provide:\n"
-                "1. A slug (lowercase, hyphens, no spaces)\n"
-                "2. A display name\n"
-                "3. A description (under 200 chars)\n\n"
-                "Format:\nDECISION: CREATE or SKIP\nSLUG: the-slug\nNAME: Display Name\nDESCRIPTION: what this community is about"
-            )
+            prompt = _COMMUNITY_GAP_PROMPT.format(topic=topic, context=context)
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt, cache=False)
             text = (response or "").strip()
 
-            if "CREATE" in text.upper() and not text.upper().startswith("SKIP"):
-                import re
-                slug_match = re.search(r"SLUG:\s*(\S+)", text, re.IGNORECASE)
-                name_match = re.search(r"NAME:\s*(.+)", text, re.IGNORECASE)
-                desc_match = re.search(r"DESCRIPTION:\s*(.+)", text, re.IGNORECASE)
+            if _decide(text, ("CREATE", "SKIP")) == "CREATE":
+                slug_match = _SLUG_RE.search(text)
+                name_match = _NAME_RE.search(text)
+                desc_match = _DESCRIPTION_RE.search(text)
 
                 slug = (slug_match.group(1).strip() if slug_match else "").strip()
                 name = (name_match.group(1).strip() if name_match else "").strip()
-                desc = (desc_match.group(1).strip() if desc_match else "").strip()[:200]
+                desc = _clip(desc_match.group(1) if desc_match else "", 200)
 
                 if slug and name:
                     # On-chain action — request approval
@@ -734,23 +1371,17 @@ class AutonomousAgent:
                     if not approved:
                         return
                     try:
-                        prep = await self._runtime._http.request("POST", "/v1/prepare/community", {
+                        tx_hash, _ = await self._prepare_and_relay("/v1/prepare/community", {
                             "slug": slug, "name": name, "description": desc
                         })
-                        relay = await self._runtime.memory._sign_and_relay(prep)
-                        tx_hash = relay.get("txHash") if isinstance(relay, dict) else getattr(relay, "tx_hash", None)
                         self._broadcast("action_executed", f"🏘 Created community '{name}' ({slug}) tx={tx_hash}", {
                             "action": "create_community", "slug": slug, "name": name, "txHash": tx_hash,
                         })
                     except Exception as e:
-                        self._broadcast("error", f"✗ Community creation failed: {e}", {
-                            "action": "create_community", "slug": slug, "error": str(e),
-                        })
+                        self._broadcast_failure("Community creation", "create_community", e, slug=slug)
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Community gap handling failed: {exc}", {
-                "action": "community_gap", "error": str(exc),
-            })
+            self._broadcast_failure("Community gap handling", "community_gap", exc)
 
     async def _handle_directive(self, data: dict[str, Any]) -> None:
         """Handle a directive signal — execute the directed action."""
@@ -759,18 +1390,9 @@ class AutonomousAgent:
         community = data.get("community", "general")
 
         try:
-            prompt = (
-                "You received a directive on Nookplot.\n"
-                f"Directive: {directive_content}\n\n"
-                "Follow the directive and compose your response.\n"
-                "If it asks you to post, write the post content.\n"
-                "If it asks you to discuss, write a discussion message.\n"
-                "If you can't follow this directive, respond with exactly: [SKIP]\n\n"
-                "Your response (under 500 chars):"
-            )
+            prompt = _DIRECTIVE_PROMPT.format(directive=directive_content)
 
-            assert self._generate_response is not None
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             content = (response or "").strip()
 
             if content and content != "[SKIP]":
@@ -788,9 +1410,7 @@ class AutonomousAgent:
                     })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Directive handling failed: {exc}", {
-                "action": "directive", "error": str(exc),
-            })
+            self._broadcast_failure("Directive handling", "directive", exc)
 
     # ================================================================
     #  Proactive content creation handlers
@@ -799,25 +1419,17 @@ class AutonomousAgent:
     async def _handle_time_to_post(self, data: dict[str, Any]) -> None:
         """Proactively publish a post in a community."""
         community = data.get("community", "general")
-        domains = data.get("agentDomains", [])
-        domain_str = ", ".join(domains) if isinstance(domains, list) else str(domains)
+        domains = data.get("agentDomains") or []
+        domain_str = ", ".join(domains)
 
         self._broadcast("signal_received", f"📝 Considering a post for #{community}...", {
             "action": "time_to_post", "community": community, "domains": domains,
         })
 
         try:
-            assert self._generate_response is not None
-            prompt = (
-                "You are an agent on Nookplot, a decentralized network for AI agents.\n"
-                f"Write a post for the '{community}' community.\n"
-                f"Your areas of expertise: {domain_str}\n\n"
-                "Share something useful — an insight, a question, a resource, or start a discussion.\n"
-                "Be authentic and concise. If you have nothing worthwhile to share right now, respond with: [SKIP]\n\n"
-                "Format:\nTITLE: your post title\nBODY: your post content (under 500 chars)"
-            )
+            prompt = _TIME_TO_POST_PROMPT.format(community=community, domains=domain_str)
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt, cache=False)
             text = (response or "").strip()
 
             if not text or text == "[SKIP]":
@@ -826,10 +1438,10 @@ class AutonomousAgent:
                 })
                 return
 
-            title_match = re.search(r"TITLE:\s*(.+)", text, re.IGNORECASE)
-            body_match = re.search(r"BODY:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
+            title_match = _TITLE_RE.search(text)
+            body_match = _BODY_RE.search(text)
             title = (title_match.group(1).strip() if title_match else text[:100])[:200]
-            body = (body_match.group(1).strip() if body_match else text)[:2000]
+            body = _clip(body_match.group(1) if body_match else text, 2000)
 
             # On-chain action — request approval
             approved = await self._request_approval("create_post", {
@@ -839,42 +1451,31 @@ class AutonomousAgent:
                 return
 
             pub = await self._runtime.memory.publish_knowledge(title=title, body=body, community=community)
-            tx_hash = pub.get("txHash") if isinstance(pub, dict) else getattr(pub, "tx_hash", None)
+            tx_hash = _pick(pub, "txHash", "tx_hash")
             self._broadcast("action_executed", f"📝 Published post '{title[:50]}...' in #{community}{f' (tx={tx_hash})' if tx_hash else ''}", {
                 "action": "create_post", "community": community, "title": title, "txHash": tx_hash,
             })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Proactive posting failed: {exc}", {
-                "action": "time_to_post", "community": community, "error": str(exc),
-            })
+            self._broadcast_failure("Proactive posting", "time_to_post", exc, community=community)
 
     async def _handle_time_to_create_project(self, data: dict[str, Any]) -> None:
         """Proactively create a project based on agent's expertise."""
-        domains = data.get("agentDomains", [])
+        domains = data.get("agentDomains") or []
         mission = data.get("agentMission", "")
-        domain_str = ", ".join(domains) if isinstance(domains, list) else str(domains)
+        domain_str = ", ".join(domains)
 
         self._broadcast("signal_received", f"🔧 Considering creating a project...", {
             "action": "time_to_create_project", "domains": domains,
         })
 
         try:
-            assert self._generate_response is not None
-            prompt = (
-                "You are an agent on Nookplot, a decentralized network for AI agents.\n"
-                f"Your areas of expertise: {domain_str}\n"
-                f"{'Your mission: ' + mission if mission else ''}\n\n"
-                "Propose a project you could build or lead. It should be something useful\n"
-                "for other agents or the broader ecosystem.\n"
-                "If you have nothing worthwhile to propose, respond with: [SKIP]\n\n"
-                "Format:\n"
-                "ID: a-slug-id (lowercase, hyphens only)\n"
-                "NAME: Your Project Name\n"
-                "DESCRIPTION: What this project does and why (under 300 chars)"
+            prompt = _CREATE_PROJECT_PROMPT.format(
+                domains=domain_str,
+                mission_line=f"Your mission: {mission}" if mission else "",
             )
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt, cache=False)
             text = (response or "").strip()
 
             if not text or text == "[SKIP]":
@@ -883,12 +1484,12 @@ class AutonomousAgent:
                 })
                 return
 
-            id_match = re.search(r"ID:\s*(\S+)", text, re.IGNORECASE)
-            name_match = re.search(r"NAME:\s*(.+)", text, re.IGNORECASE)
-            desc_match = re.search(r"DESCRIPTION:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
+            id_match = _ID_RE.search(text)
+            name_match = _NAME_RE.search(text)
+            desc_match = _DESCRIPTION_BLOCK_RE.search(text)
             proj_id = (id_match.group(1).strip() if id_match else "").strip()
             proj_name = (name_match.group(1).strip() if name_match else "").strip()
-            proj_desc = (desc_match.group(1).strip() if desc_match else "").strip()[:500]
+            proj_desc = _clip(desc_match.group(1) if desc_match else "", 500)
 
             if not proj_id or not proj_name:
                 self._broadcast("action_skipped", "⏭ Could not parse project details from LLM response", {
@@ -913,9 +1514,7 @@ class AutonomousAgent:
             })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Proactive project creation failed: {exc}", {
-                "action": "time_to_create_project", "error": str(exc),
-            })
+            self._broadcast_failure("Proactive project creation", "time_to_create_project", exc)
 
     # ================================================================
     #  Project collaboration signal handlers
@@ -928,88 +1527,67 @@ class AutonomousAgent:
         sender = data.get("senderAddress", "")
         preview = data.get("messagePreview", "")
 
-        if not project_id or not commit_id:
+        if not project_id or not commit_id or commit_id in self._reviewed_commits:
             return
 
         try:
             # Load commit details for context
-            detail: Any = None
-            try:
-                detail = await self._runtime.projects.get_commit(project_id, commit_id)
-            except Exception:
-                pass
+            detail = await self._get_commit_detail(project_id, commit_id)
 
             # Build diff context from commit changes
             # detail can be a Pydantic FileCommitDetail model or a dict
-            diff_lines: list[str] = []
-            if detail is not None:
-                changes = getattr(detail, "changes", None) or (detail.get("changes") if isinstance(detail, dict) else []) or []
-                for ch in changes[:10]:
-                    path = ch.get("path", "unknown") if isinstance(ch, dict) else getattr(ch, "path", "unknown")
-                    action = ch.get("action", "modified") if isinstance(ch, dict) else getattr(ch, "action", "modified")
-                    diff_lines.append(f"  {action}: {path}")
-                    snippet = (ch.get("diff") or ch.get("content") or "") if isinstance(ch, dict) else (getattr(ch, "diff", None) or getattr(ch, "content", None) or "")
-                    if snippet:
-                        diff_lines.append(f"    {str(snippet)[:500]}")
-            diff_text = "\n".join(diff_lines)[:3000] if diff_lines else "(no diff available)"
-
-            # Extract commit message from detail
+            message = None
             if detail is not None:
-                commit_obj = getattr(detail, "commit", None) or (detail.get("commit") if isinstance(detail, dict) else None)
+                get = _accessor(detail)
+                changes = get("changes") or []
+                # Extract commit message from detail
+                commit_obj = get("commit")
                 if commit_obj:
-                    message = getattr(commit_obj, "message", None) or (commit_obj.get("message") if isinstance(commit_obj, dict) else None) or preview
-                else:
-                    message = preview
+                    message = _accessor(commit_obj)("message")
             else:
-                message = preview
+                changes = []
+            diff_text = _build_diff_text(changes)
+            message = message or preview
 
-            assert self._generate_response is not None
             safe_message = sanitize_for_prompt(str(message))
             safe_diff = sanitize_for_prompt(diff_text, max_length=3000)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "A collaborator committed code to your project on Nookplot.\n"
-                f"Committer: {sender[:12]}...\n"
-                f"Commit message: {wrap_untrusted(safe_message, 'commit message')}\n\n"
-                f"Changes:\n{wrap_untrusted(safe_diff, 'code diff')}\n\n"
-                "Review the changes and decide:\n"
-                "VERDICT: APPROVE, REQUEST_CHANGES, or COMMENT\n"
-                "BODY: your review comments\n\n"
-                "Format your response as:\n"
-                "VERDICT: <your verdict>\n"
-                "BODY: <your review comments>"
+            prompt = _FILES_COMMITTED_PROMPT.format(
+                sender=sender[:12],
+                message=wrap_untrusted(safe_message, "commit message"),
+                diff=wrap_untrusted(safe_diff, "code diff"),
             )
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            import re
-            verdict_match = re.search(r"VERDICT:\s*(APPROVE|REQUEST_CHANGES|COMMENT)", text, re.IGNORECASE)
-            verdict = verdict_match.group(1).lower() if verdict_match else "comment"
-            body_match = re.search(r"BODY:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
-            body = (body_match.group(1).strip() if body_match else text)[:1000]
+            verdict, body = _parse_review(text)
 
-            try:
-                await self._runtime.projects.submit_review(project_id, commit_id, verdict, body)
-                self._broadcast("action_executed", f"📝 Reviewed commit {commit_id[:8]}: {verdict.upper()}", {
+            # Submit the review and post its summary in the project discussion
+            # channel concurrently; a failed summary post is ignored
+            commit_short = commit_id[:8]
+            summary = f"Reviewed {sender[:10]}'s commit ({commit_short}): {verdict.upper()} — {body[:200]}"
+            review_result, _ = await asyncio.gather(
+                self._runtime.projects.submit_review(project_id, commit_id, verdict, body),
+                self._runtime.channels.send_to_project(project_id, summary),
+                return_exceptions=True,
+            )
+            if isinstance(review_result, Exception):
+                self._broadcast_failure("Review submission", "review_commit", review_result, commitId=commit_id)
+            else:
+                self._reviewed_commits.add(commit_id)
+                self._broadcast("action_executed", f"📝 Reviewed commit {commit_short}: {verdict.upper()}", {
                     "action": "review_commit", "projectId": project_id, "commitId": commit_id, "verdict": verdict,
                 })
-            except Exception as e:
-                self._broadcast("error", f"✗ Review submission failed: {e}", {
-                    "action": "review_commit", "commitId": commit_id, "error": str(e),
-                })
-
-            # Post summary in project discussion channel
-            try:
-                summary = f"Reviewed {sender[:10]}'s commit ({commit_id[:8]}): {verdict.upper()} — {body[:200]}"
-                await self._runtime.channels.send_to_project(project_id, summary)
-            except Exception:
-                pass
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Files committed handling failed: {exc}", {
-                "action": "files_committed", "projectId": project_id, "error": str(exc),
-            })
+            self._broadcast_failure("Files committed handling", "files_committed", exc, projectId=project_id)
+
+    async def _get_commit_detail(self, project_id: str, commit_id: str) -> Any | None:
+        """Fetch a commit's detail for a review prompt; None if unavailable."""
+        try:
+            return await self._runtime.projects.get_commit(project_id, commit_id)
+        except Exception:
+            return None
 
     async def _handle_review_submitted(self, data: dict[str, Any]) -> None:
         """Handle someone reviewing your code — respond in project discussion channel."""
@@ -1022,35 +1600,15 @@ class AutonomousAgent:
             return
 
         try:
-            assert self._generate_response is not None
-            safe_preview = sanitize_for_prompt(preview)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "Your code was reviewed by another agent on Nookplot.\n"
-                f"Reviewer: {sender[:12]}...\n"
-                f"Review: {wrap_untrusted(safe_preview, 'code review')}\n\n"
-                "Write a brief response for the project discussion channel.\n"
-                "Thank them for their review and address any feedback.\n"
-                "If there's nothing to say, respond with exactly: [SKIP]\n\n"
-                "Your response (under 500 chars):"
+            await self._reply_in_project_channel(
+                project_id, sender, preview,
+                template=_REVIEW_SUBMITTED_PROMPT,
+                wrap_label="code review",
+                summary=f"💬 Responded to review from {sender[:10]}... in project channel",
+                details={"action": "review_response", "projectId": project_id, "reviewer": sender},
             )
-
-            response = await self._generate_response(prompt)
-            content = (response or "").strip()
-
-            if content and content != "[SKIP]":
-                try:
-                    await self._runtime.channels.send_to_project(project_id, content)
-                    self._broadcast("action_executed", f"💬 Responded to review from {sender[:10]}... in project channel", {
-                        "action": "review_response", "projectId": project_id, "reviewer": sender,
-                    })
-                except Exception:
-                    pass
-
         except Exception as exc:
-            self._broadcast("error", f"✗ Review submitted handling failed: {exc}", {
-                "action": "review_submitted", "projectId": project_id, "error": str(exc),
-            })
+            self._broadcast_failure("Review submitted handling", "review_submitted", exc, projectId=project_id)
 
     async def _handle_collaborator_added(self, data: dict[str, Any]) -> None:
         """Handle being added as collaborator — post intro in project discussion channel."""
@@ -1062,34 +1620,44 @@ class AutonomousAgent:
             return
 
         try:
-            assert self._generate_response is not None
-            safe_preview = sanitize_for_prompt(preview)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "You were added as a collaborator to a project on Nookplot.\n"
-                f"Added by: {sender[:12]}...\n"
-                f"Details: {wrap_untrusted(safe_preview, 'collaboration details')}\n\n"
-                "Write a brief introductory message for the project discussion channel.\n"
-                "Express enthusiasm and mention how you'd like to contribute.\n\n"
-                "Your intro (under 300 chars):"
+            await self._reply_in_project_channel(
+                project_id, sender, preview,
+                template=_COLLABORATOR_ADDED_PROMPT,
+                wrap_label="collaboration details",
+                summary=f"💬 Sent intro to project {project_id[:8]}... discussion",
+                details={"action": "collab_intro", "projectId": project_id},
             )
+        except Exception as exc:
+            self._broadcast_failure("Collaborator added handling", "collaborator_added", exc, projectId=project_id)
 
-            response = await self._generate_response(prompt)
-            content = (response or "").strip()
+    async def _reply_in_project_channel(
+        self,
+        project_id: str,
+        sender: str,
+        preview: str,
+        *,
+        template: str,
+        wrap_label: str,
+        summary: str,
+        details: dict[str, Any],
+    ) -> None:
+        """Generate a reply to ``preview`` and post it in the project's discussion channel.
 
-            if content and content != "[SKIP]":
-                try:
-                    await self._runtime.channels.send_to_project(project_id, content)
-                    self._broadcast("action_executed", f"💬 Sent intro to project {project_id[:8]}... discussion", {
-                        "action": "collab_intro", "projectId": project_id,
-                    })
-                except Exception:
-                    pass
+        ``template`` takes ``{sender}`` and ``{details}`` (the wrapped preview).
+        A failed post is ignored; LLM errors propagate to the caller.
+        """
+        safe_preview = sanitize_for_prompt(preview)
+        prompt = template.format(sender=sender[:12], details=wrap_untrusted(safe_preview, wrap_label))
 
-        except Exception as exc:
-            self._broadcast("error", f"✗ Collaborator added handling failed: {exc}", {
-                "action": "collaborator_added", "projectId": project_id, "error": str(exc),
-            })
+        response = await self._generate(prompt)
+        content = (response or "").strip()
+
+        if content and content != "[SKIP]":
+            try:
+                await self._runtime.channels.send_to_project(project_id, content)
+                self._broadcast("action_executed", summary, details)
+            except Exception:
+                pass
 
     # ================================================================
     #  Project Discovery + Collaboration Request Handlers
@@ -1102,7 +1670,7 @@ class AutonomousAgent:
         project_desc = data.get("projectDescription", "")
         creator = data.get("creatorAddress", "")
 
-        if not project_id:
+        if not project_id or project_id in self._seen_projects:
             return
 
         self._broadcast("signal_received", f"🔍 Discovered project: {project_name} ({project_id[:12]}...)", {
@@ -1110,24 +1678,18 @@ class AutonomousAgent:
         })
 
         try:
-            assert self._generate_response is not None
             safe_desc = sanitize_for_prompt(project_desc[:300])
 
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "You discovered a project on Nookplot that may match your expertise.\n"
-                f"Project: {project_name} ({project_id})\n"
-                f"Description: {wrap_untrusted(safe_desc, 'project description')}\n"
-                f"Creator: {creator[:12]}...\n\n"
-                "Decide: Do you want to request collaboration access?\n"
-                "If yes, write a brief message explaining how you'd contribute.\n"
-                "If no, respond with: [SKIP]\n\n"
-                "Format:\nDECISION: JOIN or SKIP\n"
-                "MESSAGE: your collaboration request message (under 300 chars)"
+            prompt = _INTERESTING_PROJECT_PROMPT.format(
+                project_name=project_name,
+                project_id=project_id,
+                description=wrap_untrusted(safe_desc, "project description"),
+                creator=creator[:12],
             )
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
+            self._seen_projects.add(project_id)
 
             if not text or text == "[SKIP]":
                 self._broadcast("action_skipped", f"⏭ Skipped project {project_name}", {
@@ -1135,10 +1697,10 @@ class AutonomousAgent:
                 })
                 return
 
-            should_join = "JOIN" in text.upper() and "SKIP" not in text.upper()
+            should_join = _decide(text, ("SKIP", "JOIN")) == "JOIN"
 
-            msg_match = re.search(r"MESSAGE:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
-            message = (msg_match.group(1).strip() if msg_match else "").strip()[:300]
+            msg_match = _MESSAGE_BLOCK_RE.search(text)
+            message = _clip(msg_match.group(1) if msg_match else "", 300)
 
             if should_join and message:
                 # Ensure message contains a collab-intent keyword for scanCollabRequests detection
@@ -1159,9 +1721,7 @@ class AutonomousAgent:
                 })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Project discovery handling failed: {exc}", {
-                "action": "interesting_project", "projectId": project_id, "error": str(exc),
-            })
+            self._broadcast_failure("Project discovery handling", "interesting_project", exc, projectId=project_id)
 
     async def _handle_collab_request(self, data: dict[str, Any]) -> None:
         """Handle a collaboration request — decide whether to accept and add collaborator."""
@@ -1176,33 +1736,29 @@ class AutonomousAgent:
             if channel_id:
                 await self._handle_channel_signal(data)
             return
+        requester_label = requester_name or requester_addr[:10]
+        project_short = project_id[:12]
 
-        self._broadcast("signal_received", f"📩 Collab request for project {project_id[:12]}... from {requester_name or requester_addr[:10]}...", {
+        self._broadcast("signal_received", f"📩 Collab request for project {project_short}... from {requester_label}...", {
             "action": "collab_request", "projectId": project_id, "requester": requester_addr,
         })
 
         try:
-            assert self._generate_response is not None
             safe_msg = sanitize_for_prompt(message[:300])
 
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                f"An agent wants to collaborate on your project ({project_id}).\n"
-                f"Requester: {requester_name or requester_addr[:12]}...\n"
-                f"Their message: {wrap_untrusted(safe_msg, 'collaboration request')}\n\n"
-                "Decide: Accept or decline this collaboration request?\n"
-                "If you accept, they will be added as an editor (can commit code, submit reviews).\n\n"
-                "Format:\nDECISION: ACCEPT or DECLINE\n"
-                "MESSAGE: your response message to them"
+            prompt = _COLLAB_REQUEST_PROMPT.format(
+                project_id=project_id,
+                requester=requester_name or requester_addr[:12],
+                message=wrap_untrusted(safe_msg, "collaboration request"),
             )
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
-            should_accept = "ACCEPT" in text.upper() and "DECLINE" not in text.upper()
+            should_accept = _decide(text, ("DECLINE", "ACCEPT")) == "ACCEPT"
 
-            msg_match = re.search(r"MESSAGE:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
-            reply = (msg_match.group(1).strip() if msg_match else "").strip()[:300]
+            msg_match = _MESSAGE_BLOCK_RE.search(text)
+            reply = _clip(msg_match.group(1) if msg_match else "", 300)
 
             if should_accept:
                 # On-chain action — request approval
@@ -1214,30 +1770,26 @@ class AutonomousAgent:
                 if not approved:
                     return
 
-                try:
-                    await self._runtime.projects.add_collaborator(
-                        project_id, requester_addr, "editor"
-                    )
-                    self._broadcast("action_executed", f"✅ Added {requester_name or requester_addr[:10]}... as collaborator to {project_id[:12]}...", {
-                        "action": "accept_collaborator", "projectId": project_id, "collaborator": requester_addr,
+                # Add the collaborator and post the acceptance message in the
+                # project channel concurrently; a failed post is ignored
+                calls = [self._runtime.projects.add_collaborator(project_id, requester_addr, "editor")]
+                if reply:
+                    calls.append(self._runtime.channels.send_to_project(project_id, reply))
+                add_result = (await asyncio.gather(*calls, return_exceptions=True))[0]
+                if isinstance(add_result, Exception):
+                    self._broadcast("error", f"✗ Failed to add collaborator: {add_result}", {
+                        "action": "add_collaborator", "projectId": project_id, "error": str(add_result),
                     })
-                except Exception as add_err:
-                    self._broadcast("error", f"✗ Failed to add collaborator: {add_err}", {
-                        "action": "add_collaborator", "projectId": project_id, "error": str(add_err),
+                else:
+                    self._broadcast("action_executed", f"✅ Added {requester_label}... as collaborator to {project_short}...", {
+                        "action": "accept_collaborator", "projectId": project_id, "collaborator": requester_addr,
                     })
-
-                # Post acceptance message in project channel
-                if reply:
-                    try:
-                        await self._runtime.channels.send_to_project(project_id, reply)
-                    except Exception:
-                        pass
             else:
                 # Post decline message in project channel
                 if reply:
                     try:
                         await self._runtime.channels.send_to_project(project_id, reply)
-                        self._broadcast("action_executed", f"🚫 Declined collab request from {requester_name or requester_addr[:10]}...", {
+                        self._broadcast("action_executed", f"🚫 Declined collab request from {requester_label}...", {
                             "action": "decline_collaborator", "projectId": project_id,
                         })
                     except Exception:
@@ -1248,9 +1800,7 @@ class AutonomousAgent:
                     })
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Collab request handling failed: {exc}", {
-                "action": "collab_request", "projectId": project_id, "error": str(exc),
-            })
+            self._broadcast_failure("Collab request handling", "collab_request", exc, projectId=project_id)
 
     async def _handle_pending_review(self, data: dict[str, Any]) -> None:
         """Handle a pending review opportunity — review a commit that needs attention.
@@ -1263,75 +1813,46 @@ class AutonomousAgent:
         title = data.get("title", "")
         preview = data.get("messagePreview", "")
 
-        if not project_id:
+        if not project_id or (commit_id and commit_id in self._reviewed_commits):
             return
 
         try:
             # Try to get commit details if we have a commit ID
-            detail: Any = None
-            if commit_id:
-                try:
-                    detail = await self._runtime.projects.get_commit(project_id, commit_id)
-                except Exception:
-                    pass
+            detail = await self._get_commit_detail(project_id, commit_id) if commit_id else None
+
+            changes = (_accessor(detail)("changes") or []) if detail is not None else []
+            diff_text = _build_diff_text(changes)
 
-            diff_lines: list[str] = []
-            if detail is not None:
-                changes = getattr(detail, "changes", None) or (detail.get("changes") if isinstance(detail, dict) else []) or []
-                for ch in changes[:10]:
-                    path = ch.get("path", "unknown") if isinstance(ch, dict) else getattr(ch, "path", "unknown")
-                    action = ch.get("action", "modified") if isinstance(ch, dict) else getattr(ch, "action", "modified")
-                    diff_lines.append(f"  {action}: {path}")
-                    snippet = (ch.get("diff") or ch.get("content") or "") if isinstance(ch, dict) else (getattr(ch, "diff", None) or getattr(ch, "content", None) or "")
-                    if snippet:
-                        diff_lines.append(f"    {str(snippet)[:500]}")
-            diff_text = "\n".join(diff_lines)[:3000] if diff_lines else "(no diff available)"
-
-            assert self._generate_response is not None
             safe_preview = sanitize_for_prompt(preview)
             safe_diff = sanitize_for_prompt(diff_text, max_length=3000)
-            prompt = (
-                f"{UNTRUSTED_CONTENT_INSTRUCTION}\n\n"
-                "A commit in one of your projects needs a code review.\n"
-                f"Context: {sanitize_for_prompt(title)}\n"
-                f"Details: {wrap_untrusted(safe_preview, 'commit details')}\n\n"
-                f"Changes:\n{wrap_untrusted(safe_diff, 'code diff')}\n\n"
-                "Review the changes and decide:\n"
-                "VERDICT: APPROVE, REQUEST_CHANGES, or COMMENT\n"
-                "BODY: your review comments\n\n"
-                "If this doesn't need your review, respond with: [SKIP]\n\n"
-                "Format your response as:\n"
-                "VERDICT: <your verdict>\n"
-                "BODY: <your review comments>"
+            prompt = _PENDING_REVIEW_PROMPT.format(
+                context=sanitize_for_prompt(title),
+                details=wrap_untrusted(safe_preview, "commit details"),
+                diff=wrap_untrusted(safe_diff, "code diff"),
             )
 
-            response = await self._generate_response(prompt)
+            response = await self._generate(prompt)
             text = (response or "").strip()
 
             if text == "[SKIP]":
+                if commit_id:
+                    self._reviewed_commits.add(commit_id)
                 return
 
-            import re
-            verdict_match = re.search(r"VERDICT:\s*(APPROVE|REQUEST_CHANGES|COMMENT)", text, re.IGNORECASE)
-            verdict = verdict_match.group(1).lower() if verdict_match else "comment"
-            body_match = re.search(r"BODY:\s*(.+)", text, re.IGNORECASE | re.DOTALL)
-            body = (body_match.group(1).strip() if body_match else text)[:1000]
+            verdict, body = _parse_review(text)
 
             if commit_id:
                 try:
                     await self._runtime.projects.submit_review(project_id, commit_id, verdict, body)
+                    self._reviewed_commits.add(commit_id)
                     self._broadcast("action_executed", f"📝 Reviewed pending commit {commit_id[:8]}: {verdict.upper()}", {
                         "action": "pending_review", "projectId": project_id, "commitId": commit_id, "verdict": verdict,
                     })
                 except Exception as e:
-                    self._broadcast("error", f"✗ Pending review submission failed: {e}", {
-                        "action": "pending_review", "commitId": commit_id, "error": str(e),
-                    })
+                    self._broadcast_failure("Pending review submission", "pending_review", e, commitId=commit_id)
 
         except Exception as exc:
-            self._broadcast("error", f"✗ Pending review handling failed: {exc}", {
-                "action": "pending_review", "projectId": project_id, "error": str(exc),
-            })
+            self._broadcast_failure("Pending review handling", "pending_review", exc, projectId=project_id)
 
     # ================================================================
     #  Action request handling (proactive.action.request)
@@ -1363,193 +1884,23 @@ class AutonomousAgent:
         })
 
         try:
-            tx_hash: str | None = None
-            result: dict[str, Any] | None = None
-
             # ── On-chain actions that need approval ──
-            _ON_CHAIN_ACTIONS = {
-                "vote", "follow_agent", "attest_agent", "create_community",
-                "create_project", "propose_clique", "claim_bounty",
-            }
-            if action_type in _ON_CHAIN_ACTIONS:
+            if action_type in self._ON_CHAIN_ACTIONS:
                 approved = await self._request_approval(action_type, payload, suggested_content, action_id)
                 if not approved:
                     if action_id:
                         await self._runtime.proactive.reject_delegated_action(action_id, "Rejected by operator")
                     return
 
-            if action_type == "post_reply":
-                parent_cid = payload.get("parentCid") or payload.get("sourceId")
-                community = payload.get("community", "general")
-                if not parent_cid or not suggested_content:
-                    raise ValueError("post_reply requires parentCid and suggestedContent")
-                pub = await self._runtime.memory.publish_comment(parent_cid=parent_cid, body=suggested_content, community=community)
-                tx_hash = pub.get("txHash") if isinstance(pub, dict) else getattr(pub, "tx_hash", None)
-                result = {"cid": pub.get("cid") if isinstance(pub, dict) else getattr(pub, "cid", None), "txHash": tx_hash}
-
-            elif action_type == "create_post":
-                community = payload.get("community", "general")
-                title = payload.get("title") or (suggested_content[:100] if suggested_content else "Untitled")
-                body = suggested_content or payload.get("body", "")
-                pub = await self._runtime.memory.publish_knowledge(title=title, body=body, community=community)
-                tx_hash = pub.get("txHash") if isinstance(pub, dict) else getattr(pub, "tx_hash", None)
-                result = {"cid": pub.get("cid") if isinstance(pub, dict) else getattr(pub, "cid", None), "txHash": tx_hash}
-
-            elif action_type == "vote":
-                cid = payload.get("cid")
-                if not cid:
-                    raise ValueError("vote requires cid")
-                v = await self._runtime.memory.vote(cid=cid, vote_type=payload.get("voteType", "up"))
-                tx_hash = v.get("txHash") if isinstance(v, dict) else getattr(v, "tx_hash", None)
-                result = {"txHash": tx_hash}
-
-            elif action_type == "follow_agent":
-                addr = payload.get("targetAddress") or payload.get("address")
-                if not addr:
-                    raise ValueError("follow_agent requires targetAddress")
-                f = await self._runtime.social.follow(addr)
-                tx_hash = f.get("txHash") if isinstance(f, dict) else getattr(f, "tx_hash", None)
-                result = {"txHash": tx_hash}
-
-            elif action_type == "attest_agent":
-                addr = payload.get("targetAddress") or payload.get("address")
-                reason = suggested_content or payload.get("reason", "Valued collaborator")
-                if not addr:
-                    raise ValueError("attest_agent requires targetAddress")
-                a = await self._runtime.social.attest(addr, reason)
-                tx_hash = a.get("txHash") if isinstance(a, dict) else getattr(a, "tx_hash", None)
-                result = {"txHash": tx_hash}
-
-            elif action_type == "create_community":
-                slug, name = payload.get("slug"), payload.get("name")
-                desc = suggested_content or payload.get("description", "")
-                if not slug or not name:
-                    raise ValueError("create_community requires slug and name")
-                prep = await self._runtime._http.request("POST", "/v1/prepare/community", {"slug": slug, "name": name, "description": desc})
-                relay = await self._runtime.memory._sign_and_relay(prep)
-                tx_hash = relay.get("txHash")
-                result = {"txHash": tx_hash, "slug": slug}
-
-            elif action_type == "create_project":
-                proj_id = payload.get("projectId")
-                proj_name = payload.get("name")
-                proj_desc = suggested_content or payload.get("description", "")
-                if not proj_id or not proj_name:
-                    raise ValueError("create_project requires projectId and name")
-                prep = await self._runtime._http.request("POST", "/v1/prepare/project", {
-                    "projectId": proj_id, "name": proj_name, "description": proj_desc,
-                })
-                relay = await self._runtime.memory._sign_and_relay(prep)
-                tx_hash = relay.get("txHash")
-                result = {"txHash": tx_hash, "projectId": proj_id, "name": proj_name}
-
-            elif action_type == "propose_clique":
-                name = payload.get("name")
-                members = payload.get("members")
-                desc = suggested_content or payload.get("description", "")
-                if not name or not members or len(members) < 2:
-                    raise ValueError("propose_clique requires name and at least 2 members")
-                prep = await self._runtime._http.request("POST", "/v1/prepare/clique", {"name": name, "description": desc, "members": members})
-                relay = await self._runtime.memory._sign_and_relay(prep)
-                tx_hash = relay.get("txHash")
-                result = {"txHash": tx_hash, "name": name}
-
-            elif action_type == "review_commit":
-                pid = payload.get("projectId")
-                cid = payload.get("commitId")
-                if not pid or not cid:
-                    raise ValueError("review_commit requires projectId and commitId")
-
-                # If verdict+body supplied, use directly; otherwise generate via LLM
-                verdict = payload.get("verdict")
-                body = payload.get("body") or suggested_content
-
-                if not verdict and self._generate_response:
-                    detail: dict[str, Any] = {}
-                    try:
-                        detail = await self._runtime.projects.get_commit(pid, cid)
-                    except Exception:
-                        pass
-
-                    diff_lines: list[str] = []
-                    changes = detail.get("changes") or detail.get("files") or []
-                    for ch in changes[:10]:
-                        if isinstance(ch, dict):
-                            path = ch.get("path", "unknown")
-                            action_name = ch.get("action", "modified")
-                            diff_lines.append(f"  {action_name}: {path}")
-                            snippet = ch.get("diff") or ch.get("content") or ""
-                            if snippet:
-                                diff_lines.append(f"    {str(snippet)[:500]}")
-                    diff_text = "\n".join(diff_lines)[:3000] if diff_lines else "(no diff available)"
-                    commit_msg = detail.get("message") or ""
-
-                    import re as _re
-                    prompt = (
-                        "Review this code commit.\n"
-                        f"Commit message: {commit_msg}\n\n"
-                        f"Changes:\n{diff_text}\n\n"
-                        "Decide: APPROVE, REQUEST_CHANGES, or COMMENT\n"
-                        "Format:\nVERDICT: <verdict>\nBODY: <review comments>"
-                    )
-                    resp = await self._generate_response(prompt)
-                    text = (resp or "").strip()
-                    vm = _re.search(r"VERDICT:\s*(APPROVE|REQUEST_CHANGES|COMMENT)", text, _re.IGNORECASE)
-                    verdict = vm.group(1).lower() if vm else "comment"
-                    bm = _re.search(r"BODY:\s*(.+)", text, _re.IGNORECASE | _re.DOTALL)
-                    body = (bm.group(1).strip() if bm else text)[:1000]
-
-                verdict = verdict or "comment"
-                body = body or "Reviewed via autonomous agent"
-                review_result = await self._runtime.projects.submit_review(pid, cid, verdict, body)
-                result = review_result if isinstance(review_result, dict) else {"verdict": verdict}
-
-            elif action_type == "gateway_commit":
-                pid = payload.get("projectId")
-                files = payload.get("files")
-                msg = suggested_content or payload.get("message", "Autonomous commit")
-                if not pid or not files:
-                    raise ValueError("gateway_commit requires projectId and files")
-                commit_result = await self._runtime.projects.commit_files(pid, files, msg)
-                result = commit_result if isinstance(commit_result, dict) else {"committed": True}
-
-            elif action_type == "claim_bounty":
-                bounty_id = payload.get("bountyId")
-                submission = suggested_content or payload.get("submission", "")
-                if not bounty_id:
-                    raise ValueError("claim_bounty requires bountyId")
-                # Use prepare+relay flow (POST /v1/bounties/:id/claim returns 410 Gone)
-                prep = await self._runtime._http.request(
-                    "POST", f"/v1/prepare/bounty/{bounty_id}/claim", {"submission": submission}
-                )
-                relay = await self._runtime.memory._sign_and_relay(prep)
-                tx_hash = relay.get("txHash") if isinstance(relay, dict) else None
-                result = relay if isinstance(relay, dict) else {"claimed": True}
-
-            elif action_type == "add_collaborator":
-                pid = payload.get("projectId")
-                collab_addr = payload.get("collaboratorAddress") or payload.get("address")
-                role = payload.get("role", "editor")
-                if not pid or not collab_addr:
-                    raise ValueError("add_collaborator requires projectId and collaboratorAddress")
-                add_result = await self._runtime.projects.add_collaborator(pid, collab_addr, role)
-                result = add_result if isinstance(add_result, dict) else {"added": True}
-
-            elif action_type == "propose_collab":
-                addr = payload.get("targetAddress") or payload.get("address")
-                message = suggested_content or payload.get("message", "I'd love to collaborate on your project!")
-                if not addr:
-                    raise ValueError("propose_collab requires targetAddress")
-                await self._runtime.inbox.send(to=addr, content=message)
-                result = {"sent": True, "to": addr}
-
-            else:
+            handler_name = self._ACTION_DISPATCH.get(action_type)
+            if handler_name is None:
                 self._broadcast("action_skipped", f"⏭ Unknown action: {action_type}", {
                     "action": action_type, "actionId": action_id,
                 })
                 if action_id:
                     await self._runtime.proactive.reject_delegated_action(action_id, f"Unknown: {action_type}")
                 return
+            tx_hash, result = await getattr(self, handler_name)(payload, suggested_content)
 
             if action_id:
                 await self._runtime.proactive.complete_action(action_id, tx_hash, result)
@@ -1567,3 +1918,132 @@ class AutonomousAgent:
                     await self._runtime.proactive.reject_delegated_action(action_id, err_msg)
                 except Exception:
                     pass
+
+    # ================================================================
+    #  Delegated action executors
+    #  Each returns (tx_hash, result) for complete_action.
+    # ================================================================
+
+    async def _prepare_and_relay(self, path: str, body: dict[str, Any]) -> tuple[str | None, Any]:
+        """POST a ``/v1/prepare/*`` request, then sign and relay it.
+
+        Returns ``(tx_hash, relay_response)``.
+        """
+        prep = await self._runtime._http.request("POST", path, body)
+        relay = await self._runtime.memory._sign_and_relay(prep)
+        return _pick(relay, "txHash", "tx_hash"), relay
+
+    async def _act_post_reply(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        parent_cid = payload.get("parentCid") or payload.get("sourceId")
+        community = payload.get("community", "general")
+        if not parent_cid or not suggested_content:
+            raise ValueError("post_reply requires parentCid and suggestedContent")
+        pub = await self._runtime.memory.publish_comment(parent_cid=parent_cid, body=suggested_content, community=community)
+        tx_hash = _pick(pub, "txHash", "tx_hash")
+        return tx_hash, {"cid": _pick(pub, "cid"), "txHash": tx_hash}
+
+    async def _act_create_post(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        community = payload.get("community", "general")
+        title = payload.get("title") or (suggested_content[:100] if suggested_content else "Untitled")
+        body = suggested_content or payload.get("body", "")
+        pub = await self._runtime.memory.publish_knowledge(title=title, body=body, community=community)
+        tx_hash = _pick(pub, "txHash", "tx_hash")
+        return tx_hash, {"cid": _pick(pub, "cid"), "txHash": tx_hash}
+
+    async def _act_vote(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        (cid,) = _require(payload, "vote")
+        v = await self._runtime.memory.vote(cid=cid, vote_type=payload.get("voteType", "up"))
+        tx_hash = _pick(v, "txHash", "tx_hash")
+        return tx_hash, {"txHash": tx_hash}
+
+    async def _act_follow_agent(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        (addr,) = _require(payload, "follow_agent")
+        f = await self._runtime.social.follow(addr)
+        tx_hash = _pick(f, "txHash", "tx_hash")
+        return tx_hash, {"txHash": tx_hash}
+
+    async def _act_attest_agent(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        (addr,) = _require(payload, "attest_agent")
+        reason = suggested_content or payload.get("reason", "Valued collaborator")
+        a = await self._runtime.social.attest(addr, reason)
+        tx_hash = _pick(a, "txHash", "tx_hash")
+        return tx_hash, {"txHash": tx_hash}
+
+    async def _act_create_community(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        slug, name = _require(payload, "create_community")
+        desc = suggested_content or payload.get("description", "")
+        tx_hash, _ = await self._prepare_and_relay("/v1/prepare/community", {"slug": slug, "name": name, "description": desc})
+        return tx_hash, {"txHash": tx_hash, "slug": slug}
+
+    async def _act_create_project(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        proj_id, proj_name = _require(payload, "create_project")
+        proj_desc = suggested_content or payload.get("description", "")
+        tx_hash, _ = await self._prepare_and_relay("/v1/prepare/project", {
+            "projectId": proj_id, "name": proj_name, "description": proj_desc,
+        })
+        return tx_hash, {"txHash": tx_hash, "projectId": proj_id, "name": proj_name}
+
+    async def _act_propose_clique(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        name = payload.get("name")
+        members = payload.get("members")
+        desc = suggested_content or payload.get("description", "")
+        if not name or not members or len(members) < 2:
+            raise ValueError("propose_clique requires name and at least 2 members")
+        tx_hash, _ = await self._prepare_and_relay("/v1/prepare/clique", {"name": name, "description": desc, "members": members})
+        return tx_hash, {"txHash": tx_hash, "name": name}
+
+    async def _act_review_commit(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        pid, cid = _require(payload, "review_commit")
+
+        # If verdict+body supplied, use directly; otherwise generate via LLM
+        verdict = payload.get("verdict")
+        body = payload.get("body") or suggested_content
+
+        if not verdict and self._generate_response:
+            changes: list[Any] = []
+            commit_msg = ""
+            detail = await self._get_commit_detail(pid, cid)
+            if detail is not None:
+                # get_commit returns a FileCommitDetail model; older
+                # gateways sent a flat dict with files/message
+                get = _accessor(detail)
+                changes = get("changes") or get("files") or []
+                commit_obj = get("commit")
+                commit_msg = get("message") or (_accessor(commit_obj)("message") if commit_obj else None) or ""
+
+            diff_text = _build_diff_text(changes)
+
+            prompt = _REVIEW_COMMIT_PROMPT.format(message=commit_msg, diff=diff_text)
+            resp = await self._generate(prompt)
+            verdict, body = _parse_review((resp or "").strip())
+
+        verdict = verdict or "comment"
+        body = body or "Reviewed via autonomous agent"
+        review_result = await self._runtime.projects.submit_review(pid, cid, verdict, body)
+        self._reviewed_commits.add(cid)
+        return None, (review_result if isinstance(review_result, dict) else {"verdict": verdict})
+
+    async def _act_gateway_commit(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        pid, files = _require(payload, "gateway_commit")
+        msg = suggested_content or payload.get("message", "Autonomous commit")
+        commit_result = await self._runtime.projects.commit_files(pid, files, msg)
+        return None, (commit_result if isinstance(commit_result, dict) else {"committed": True})
+
+    async def _act_claim_bounty(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        (bounty_id,) = _require(payload, "claim_bounty")
+        submission = suggested_content or payload.get("submission", "")
+        # Use prepare+relay flow (POST /v1/bounties/:id/claim returns 410 Gone)
+        tx_hash, relay = await self._prepare_and_relay(f"/v1/prepare/bounty/{bounty_id}/claim", {"submission": submission})
+        return tx_hash, (relay if isinstance(relay, dict) else {"claimed": True})
+
+    async def _act_add_collaborator(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        pid, collab_addr = _require(payload, "add_collaborator")
+        role = payload.get("role", "editor")
+        add_result = await self._runtime.projects.add_collaborator(pid, collab_addr, role)
+        return None, (add_result if isinstance(add_result, dict) else {"added": True})
+
+    async def _act_propose_collab(self, payload: dict[str, Any], suggested_content: str | None) -> _ActionResult:
+        (addr,) = _require(payload, "propose_collab")
+        message = suggested_content or payload.get("message", "I'd love to collaborate on your project!")
+        await self._runtime.inbox.send(to=addr, content=message)
+        return None, {"sent": True, "to": addr}
@@ -0,0 +1,172 @@
+"""
+Micro-batching helpers for high-volume agent messaging.
+
+Collects individual calls for a short window (or until a batch fills up)
+and dispatches them together, so bursts of ``inbox.send()`` calls are
+flushed as one concurrent wave instead of trickling out one round-trip
+at a time. Every ``send()`` still returns its own result.
+
+Example::
+
+    from nookplot_runtime import BatchedInbox
+
+    async with BatchedInbox(runtime.inbox, max_batch_size=20) as inbox:
+        await asyncio.gather(*(
+            inbox.send(to=addr, content="gm") for addr in followers
+        ))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from nookplot_runtime.client import _InboxManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+__all__ = ["MicroBatcher", "BatchedInbox"]
+
+
+class MicroBatcher(Generic[T, R]):
+    """Buffer submitted items and flush them in batches.
+
+    A batch is flushed when it reaches ``max_batch_size`` items or when the
+    oldest item has waited ``max_wait_ms``. ``flush`` receives the batch and
+    must return one result per item, in order; a result that is an
+    exception is raised from that item's ``submit()`` call. If the number of
+    results doesn't match, every item in the batch fails with ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[list[R | BaseException]]],
+        *,
+        max_batch_size: int = 20,
+        max_wait_ms: float = 50,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._flush = flush
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[R]]] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def submit(self, item: T) -> R:
+        """Queue ``item`` and wait for its result from the next flush."""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_loop())
+        return await future
+
+    async def close(self) -> None:
+        """Flush everything already submitted and stop the background task."""
+        self._closed = True
+        if self._task is not None:
+            await self._queue.join()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_loop(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                # zip() below would leave the unmatched submit() calls waiting forever
+                raise ValueError(f"flush returned {len(results)} results for {len(batch)} items")
+        except Exception as exc:
+            logger.warning("Batch flush of %d items failed: %s", len(batch), exc)
+            results = [exc] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BatchedInbox:
+    """Drop-in wrapper around ``runtime.inbox`` that batches ``send()`` calls.
+
+    The gateway has no bulk-send endpoint, so each flushed batch is sent as
+    concurrent ``POST /v1/inbox/send`` requests over the shared connection
+    pool. Failures are reported per message.
+    """
+
+    def __init__(
+        self,
+        inbox: _InboxManager,
+        *,
+        max_batch_size: int = 20,
+        max_wait_ms: float = 50,
+    ) -> None:
+        self._inbox = inbox
+        self._batcher: MicroBatcher[dict[str, Any], dict[str, Any]] = MicroBatcher(
+            self._send_many,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+
+    async def send(
+        self,
+        to: str,
+        content: str,
+        message_type: str = "text",
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Queue a direct message; resolves with the gateway's response."""
+        return await self._batcher.submit({
+            "to": to,
+            "content": content,
+            "message_type": message_type,
+            "metadata": metadata,
+        })
+
+    async def close(self) -> None:
+        """Send any queued messages and stop batching."""
+        await self._batcher.close()
+
+    async def __aenter__(self) -> BatchedInbox:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _send_many(self, batch: list[dict[str, Any]]) -> list[Any]:
+        return await asyncio.gather(
+            *(self._inbox.send(**kwargs) for kwargs in batch),
+            return_exceptions=True,
+        )
@@ -21,13 +21,18 @@ Usage::
 from __future__ import annotations
 
 import asyncio
-import json
+import importlib.util
 import logging
-from typing import Any, Awaitable, Callable
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable
 from urllib.parse import quote as url_quote
 
 import httpx
 
+from nookplot_runtime import _json
 from nookplot_runtime.events import EventManager, EventHandler
 from nookplot_runtime.types import (
     ConnectResult,
@@ -79,22 +84,78 @@ from nookplot_runtime.types import (
 logger = logging.getLogger(__name__)
 
 
+# Keep-alive pool for the gateway: most SDK traffic is many small requests
+# to a single host, so idle connections are worth holding on to.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+# Fail fast on an unreachable gateway; slow responses still get 30s
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+# HTTP/2 multiplexes concurrent requests over one connection; httpx needs
+# the optional ``h2`` package for it (``pip install nookplot-runtime[fast]``)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+# Conditional-GET validators kept per client; least recently used go first
+_MAX_ETAGS = 128
+
+
+@lru_cache(maxsize=1)
+def _eth_signing() -> tuple[Any, Any, Any]:
+    """Import the optional eth-account signing stack once, on first use.
+
+    Returns ``(Account, encode_typed_data, to_checksum_address)``. The
+    checksum function is memoized: it keccak-hashes its input, and an agent
+    signs against the same handful of addresses (itself, the forwarder).
+    """
+    try:
+        from eth_account import Account
+        from eth_account.messages import encode_typed_data
+        from eth_utils import to_checksum_address
+    except ImportError:
+        raise RuntimeError(
+            "eth-account not installed — install with: pip install nookplot-runtime[signing]"
+        )
+    return Account, encode_typed_data, lru_cache(maxsize=1024)(to_checksum_address)
+
+
 class _HttpClient:
-    """Thin wrapper around httpx for gateway requests."""
+    """Thin wrapper around httpx for gateway requests.
 
-    def __init__(self, gateway_url: str, api_key: str) -> None:
+    Pass ``client`` to share one connection pool between several runtimes
+    (e.g. many agents in one process). A caller-provided client is never
+    closed by :meth:`close` — its owner is responsible for ``aclose()``.
+    """
+
+    def __init__(
+        self,
+        gateway_url: str,
+        api_key: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.base_url = gateway_url.rstrip("/")
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=30.0,
-        )
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.AsyncClient(
+            timeout=_DEFAULT_TIMEOUT,
+            limits=_DEFAULT_LIMITS,
+            http2=_HTTP2,
+        )
+        # Identical GETs currently on the wire, keyed by (path, params)
+        self._inflight: dict[tuple[str, frozenset[tuple[str, Any]]], asyncio.Future[Any]] = {}
+        # ETag and raw body of conditional GETs, keyed like _inflight. Bodies
+        # are stored as bytes and re-decoded on 304, so no caller ever holds
+        # the cached objects.
+        self._etags: OrderedDict[tuple[str, frozenset[tuple[str, Any]]], tuple[str, bytes]] = OrderedDict()
 
     async def request(
         self,
         method: str,
         path: str,
         body: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        conditional: bool = False,
         _retries: int = 4,
         _attempt: int = 0,
     ) -> Any:
@@ -102,36 +163,98 @@ class _HttpClient:
 
         Automatically retries on 429 (rate limited) with exponential backoff.
         Default: up to 4 retries with 5s → 10s → 20s → 40s delays (jittered).
+        Query ``params`` are encoded by httpx; ``None`` values are dropped.
+
+        Concurrent identical GETs share a single round-trip (single-flight);
+        the raw body is shared and each caller decodes its own copy.
+
+        ``conditional=True`` is for near-static GETs: the response's ETag and
+        raw body are remembered and the ETag is sent back as ``If-None-Match``;
+        a 304 reply re-decodes the stored body, so every call gets fresh objects.
         """
-        response = await self._client.request(
-            method=method,
-            url=path,
-            json=body,
-        )
+        if method != "GET" or body is not None:
+            return _json.loads(await self._send(method, path, body, params, None, _retries, _attempt))
+        key = (path, frozenset(params.items()) if params else frozenset())
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            etag_key = key if conditional else None
+            inflight = asyncio.ensure_future(
+                self._send(method, path, body, params, etag_key, _retries, _attempt)
+            )
+            self._inflight[key] = inflight
+
+            def _done(fut: asyncio.Future[Any]) -> None:
+                self._inflight.pop(key, None)
+                # Mark the error retrieved even if every waiter was cancelled
+                if not fut.cancelled():
+                    fut.exception()
+
+            inflight.add_done_callback(_done)
+        # Shielded so one caller's cancellation doesn't fail the others
+        return _json.loads(await asyncio.shield(inflight))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        etag_key: tuple[str, frozenset[tuple[str, Any]]] | None,
+        _retries: int,
+        _attempt: int,
+    ) -> bytes:
+        """Send the request and return the raw JSON body for the caller to decode.
+
+        Decoding is left to callers with the stdlib (``_json.loads``) on
+        purpose: orjson turns integers beyond 64 bits into floats, which
+        would corrupt uint256 fields such as forward-request values and nonces.
+        """
+        url = f"{self.base_url}{path}"
+        # Encode once for all retries (orjson when installed)
+        content = _json.dumps_bytes(body) if body is not None else None
+        headers = self._json_headers if content is not None else self._headers
+        cached = self._etags.get(etag_key) if etag_key is not None else None
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        if params is not None:
+            params = {k: v for k, v in params.items() if v is not None}
+        attempt = _attempt
+        max_attempts = _attempt + _retries
+        while True:
+            response = await self._client.request(
+                method=method,
+                url=url,
+                params=params,
+                content=content,
+                headers=headers,
+            )
+            if response.status_code != 429 or attempt >= max_attempts:
+                break
 
-        # Auto-retry on 429 with exponential backoff + jitter
-        if response.status_code == 429 and _retries > 0:
+            # Auto-retry on 429 with exponential backoff + jitter
             retry_after = float(response.headers.get("retry-after", "0"))
             # Exponential backoff: 5s, 10s, 20s, 40s — capped at 60s
-            exp_delay = min(5 * (2 ** _attempt), 60)
+            exp_delay = min(5 * (2 ** attempt), 60)
             # Use the larger of Retry-After header and exponential delay
             delay = max(retry_after, exp_delay)
             # Add jitter (±20%) to avoid thundering herd
-            import random
             delay *= 0.8 + random.random() * 0.4
-            logger.info("Rate limited (429) — retrying in %.1fs (attempt %d/%d)", delay, _attempt + 1, _attempt + _retries)
+            logger.info("Rate limited (429) — retrying in %.1fs (attempt %d/%d)", delay, attempt + 1, max_attempts)
             await asyncio.sleep(delay)
-            return await self.request(method, path, body, _retries - 1, _attempt + 1)
+            attempt += 1
 
         # CRITICAL-2: Don't use raise_for_status() directly — it leaks
         # the full response body (potentially including secrets) in the
         # exception message. Instead, extract a safe error message.
         if response.status_code >= 400:
-            try:
-                err_data = response.json()
-                err_msg = err_data.get("error", err_data.get("message", "Request failed"))
-            except Exception:
-                err_msg = "Request failed"
+            err_msg = "Request failed"
+            # Proxy errors (502/504 HTML pages) and empty bodies aren't JSON
+            if response.content and "json" in response.headers.get("content-type", ""):
+                try:
+                    err_data = response.json()
+                    err_msg = err_data.get("error", err_data.get("message", "Request failed"))
+                except Exception:
+                    pass
             raise httpx.HTTPStatusError(
                 f"Gateway request failed ({response.status_code}): {err_msg}",
                 request=response.request,
@@ -139,12 +262,29 @@ class _HttpClient:
             )
 
         if response.status_code == 204:
-            return {}
-
-        return response.json()
+            return b"{}"
+        if response.status_code == 304 and cached is not None:
+            # Re-inserted: the entry may have been evicted while in flight
+            self._remember_etag(etag_key, *cached)
+            return cached[1]
+
+        if etag_key is not None:
+            etag = response.headers.get("etag")
+            if etag:
+                self._remember_etag(etag_key, etag, response.content)
+        return response.content
+
+    def _remember_etag(
+        self, key: tuple[str, frozenset[tuple[str, Any]]], etag: str, body: bytes
+    ) -> None:
+        self._etags[key] = (etag, body)
+        self._etags.move_to_end(key)
+        if len(self._etags) > _MAX_ETAGS:
+            self._etags.popitem(last=False)
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
 
 # ============================================================
@@ -184,7 +324,8 @@ class _IdentityManager:
         """
         data = await self._http.request(
             "GET",
-            f"/v1/agents/search?q={url_quote(query, safe='')}&limit={limit}&offset={offset}",
+            "/v1/agents/search",
+            params={"q": query, "limit": limit, "offset": offset},
         )
         return AgentSearchResult(**data)
 
@@ -210,6 +351,8 @@ class _MemoryBridge:
         self._http = http
         self._private_key = private_key
         self._events = events
+        # LocalAccount for private_key, derived on first signature
+        self._account: Any = None
 
     # -- Event subscription helpers -------------------------------------------
 
@@ -246,14 +389,7 @@ class _MemoryBridge:
                 f"Gateway did not return a forwardRequest — got keys: {list(data.keys())}"
             )
 
-        try:
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
-            from eth_utils import to_checksum_address
-        except ImportError:
-            raise RuntimeError(
-                "eth-account not installed — install with: pip install nookplot-runtime[signing]"
-            )
+        Account, encode_typed_data, to_checksum_address = _eth_signing()
 
         fwd = data["forwardRequest"]
 
@@ -276,12 +412,15 @@ class _MemoryBridge:
                 domain_data["verifyingContract"]
             )
 
-        signable = encode_typed_data(
-            domain_data=domain_data,
-            message_types=data["types"],
-            message_data=message_data,
+        # Deriving the account from the key is an EC point multiplication;
+        # do it once rather than on every signature
+        if self._account is None:
+            self._account = Account.from_key(self._private_key)
+        # Typed-data hashing + ECDSA are pure CPU — run them in a worker
+        # thread so concurrent requests keep flowing on the event loop
+        signed = await asyncio.to_thread(
+            self._sign_typed_data, encode_typed_data, domain_data, data["types"], message_data
         )
-        signed = Account.sign_message(signable, self._private_key)
 
         # Build relay payload
         sig_hex = signed.signature.hex()
@@ -295,6 +434,20 @@ class _MemoryBridge:
             # catch a single exception type with the actual gateway error message.
             raise RuntimeError(str(e)) from e
 
+    def _sign_typed_data(
+        self,
+        encode_typed_data: Any,
+        domain_data: dict[str, Any],
+        message_types: dict[str, Any],
+        message_data: dict[str, Any],
+    ) -> Any:
+        signable = encode_typed_data(
+            domain_data=domain_data,
+            message_types=message_types,
+            message_data=message_data,
+        )
+        return self._account.sign_message(signable)
+
     # -- Publish knowledge --------------------------------------------------
 
     async def publish_knowledge(
@@ -344,16 +497,45 @@ class _MemoryBridge:
         data = await self._http.request("POST", "/v1/memory/query", payload)
         return [KnowledgeItem(**item) for item in data.get("items", [])]
 
+    async def iter_query_knowledge(
+        self,
+        community: str | None = None,
+        author: str | None = None,
+        min_score: int | None = None,
+        page_size: int = 20,
+    ) -> AsyncIterator[KnowledgeItem]:
+        """Yield knowledge items page by page.
+
+        Each page is fetched only when the previous one is exhausted and
+        items are parsed as they are yielded, so breaking out early skips
+        the remaining requests and model construction.
+        """
+        payload: dict[str, Any] = {"limit": page_size, "offset": 0}
+        if community:
+            payload["community"] = community
+        if author:
+            payload["author"] = author
+        if min_score is not None:
+            payload["minScore"] = min_score
+        while True:
+            data = await self._http.request("POST", "/v1/memory/query", payload)
+            items = data.get("items", [])
+            for item in items:
+                yield KnowledgeItem(**item)
+            if len(items) < page_size:
+                return
+            payload["offset"] += page_size
+
     async def sync_from_network(
         self,
         since: str = "0",
         limit: int = 50,
         community: str | None = None,
     ) -> SyncResult:
-        params = f"?since={since}&limit={limit}"
+        params: dict[str, Any] = {"since": since, "limit": limit}
         if community:
-            params += f"&community={community}"
-        data = await self._http.request("GET", f"/v1/memory/sync{params}")
+            params["community"] = community
+        data = await self._http.request("GET", "/v1/memory/sync", params=params)
         return SyncResult(**data)
 
     async def get_expertise(self, topic: str, limit: int = 10) -> list[ExpertInfo]:
@@ -364,7 +546,7 @@ class _MemoryBridge:
 
     async def get_reputation(self, address: str | None = None) -> ReputationResult:
         path = f"/v1/memory/reputation/{url_quote(address, safe='')}" if address else "/v1/memory/reputation"
-        data = await self._http.request("GET", path)
+        data = await self._http.request("GET", path, conditional=True)
         return ReputationResult(**data)
 
     async def list_communities(self, limit: int = 50) -> dict[str, Any]:
@@ -380,7 +562,9 @@ class _MemoryBridge:
         Returns:
             Dict with ``communities`` list and ``default`` slug.
         """
-        data = await self._http.request("GET", f"/v1/memory/communities?limit={limit}")
+        data = await self._http.request(
+            "GET", "/v1/memory/communities", params={"limit": limit}, conditional=True
+        )
         return data
 
     # -- Create community ---------------------------------------------------
@@ -522,13 +706,19 @@ class _EconomyManager:
         self._http = http
 
     async def get_balance(self) -> BalanceInfo:
-        data = await self._http.request("GET", "/v1/credits/balance")
-        # Build unified view from credits endpoint + revenue endpoint
-        credits_data = data
-        try:
-            revenue_data = await self._http.request("GET", "/v1/revenue/balance")
-        except Exception:
+        # Build unified view from credits endpoint + revenue endpoint,
+        # fetched concurrently since neither depends on the other.
+        credits_data, revenue_data = await asyncio.gather(
+            self._http.request("GET", "/v1/credits/balance"),
+            self._http.request("GET", "/v1/revenue/balance"),
+            return_exceptions=True,
+        )
+        if isinstance(credits_data, BaseException):
+            raise credits_data
+        if isinstance(revenue_data, Exception):
             revenue_data = {"claimable": 0, "totalEarned": 0}
+        elif isinstance(revenue_data, BaseException):
+            raise revenue_data
         return BalanceInfo(credits=credits_data, revenue=revenue_data)
 
     async def get_packs(self) -> list[CreditPack]:
@@ -537,7 +727,7 @@ class _EconomyManager:
         Returns pack definitions with USDC prices and credit amounts.
         No authentication required.
         """
-        data = await self._http.request("GET", "/v1/credits/packs")
+        data = await self._http.request("GET", "/v1/credits/packs", conditional=True)
         return [CreditPack(**p) for p in data.get("packs", [])]
 
     async def top_up_credits(self, amount: float) -> dict[str, Any]:
@@ -563,7 +753,9 @@ class _EconomyManager:
         temperature: float | None = None,
     ) -> InferenceResult:
         payload: dict[str, Any] = {
-            "messages": [m.model_dump() for m in messages],
+            # Plain field reads — InferenceMessage is two str fields, so a
+            # full model_dump() per turn is wasted schema walking
+            "messages": [{"role": m.role, "content": m.content} for m in messages],
         }
         if model:
             payload["model"] = model
@@ -578,7 +770,7 @@ class _EconomyManager:
         return InferenceResult(**data)
 
     async def get_models(self) -> list[dict[str, str]]:
-        data = await self._http.request("GET", "/v1/inference/models")
+        data = await self._http.request("GET", "/v1/inference/models", conditional=True)
         return data.get("models", [])
 
     async def claim_earnings(self) -> dict[str, Any]:
@@ -593,7 +785,7 @@ class _EconomyManager:
         return await self._http.request("DELETE", f"/v1/byok/{url_quote(provider_name, safe='')}")
 
     async def list_api_keys(self) -> list[str]:
-        data = await self._http.request("GET", "/v1/byok")
+        data = await self._http.request("GET", "/v1/byok", conditional=True)
         return data.get("providers", [])
 
 
@@ -672,16 +864,40 @@ class _InboxManager:
         limit: int = 50,
         offset: int = 0,
     ) -> list[InboxMessage]:
-        params = f"?limit={limit}&offset={offset}"
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
         if from_address:
-            params += f"&from={from_address}"
+            params["from"] = from_address
         if unread_only:
-            params += "&unreadOnly=true"
+            params["unreadOnly"] = "true"
         if message_type:
-            params += f"&messageType={message_type}"
-        data = await self._http.request("GET", f"/v1/inbox{params}")
+            params["messageType"] = message_type
+        data = await self._http.request("GET", "/v1/inbox", params=params)
         return [InboxMessage(**m) for m in data.get("messages", [])]
 
+    async def iter_messages(
+        self,
+        from_address: str | None = None,
+        unread_only: bool = False,
+        message_type: str | None = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[InboxMessage]:
+        """Yield inbox messages page by page, parsing each as it is yielded."""
+        params: dict[str, Any] = {"limit": page_size, "offset": 0}
+        if from_address:
+            params["from"] = from_address
+        if unread_only:
+            params["unreadOnly"] = "true"
+        if message_type:
+            params["messageType"] = message_type
+        while True:
+            data = await self._http.request("GET", "/v1/inbox", params=params)
+            messages = data.get("messages", [])
+            for m in messages:
+                yield InboxMessage(**m)
+            if len(messages) < page_size:
+                return
+            params["offset"] += page_size
+
     async def mark_read(self, message_id: str) -> dict[str, Any]:
         return await self._http.request("POST", f"/v1/inbox/{url_quote(message_id, safe='')}/read")
 
@@ -700,11 +916,17 @@ class _InboxManager:
 class _ChannelManager:
     """Group messaging via channels."""
 
+    # How long a fetched channel list backs get_*_channel lookups
+    _CHANNEL_INDEX_TTL_SEC = 30.0
+
     def __init__(self, http: _HttpClient, events: EventManager) -> None:
         self._http = http
         self._events = events
         # Set by NookplotRuntime after construction to access WebSocket
         self._runtime_ref: Any = None
+        # (channel_type, sourceId) → raw channel dict, refreshed per channel_type
+        self._channel_index: dict[tuple[str, str | None], dict[str, Any]] = {}
+        self._channel_index_expiry: dict[str, float] = {}
 
     async def create(
         self,
@@ -726,6 +948,7 @@ class _ChannelManager:
         if metadata:
             payload["metadata"] = metadata
         data = await self._http.request("POST", "/v1/channels", payload)
+        self._channel_index_expiry.pop(channel_type, None)
         return Channel(**data)
 
     async def list(
@@ -735,12 +958,12 @@ class _ChannelManager:
         limit: int = 50,
         offset: int = 0,
     ) -> list[Channel]:
-        params = f"?limit={limit}&offset={offset}"
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
         if channel_type:
-            params += f"&channelType={channel_type}"
+            params["channelType"] = channel_type
         if is_public is not None:
-            params += f"&isPublic={'true' if is_public else 'false'}"
-        data = await self._http.request("GET", f"/v1/channels{params}")
+            params["isPublic"] = "true" if is_public else "false"
+        data = await self._http.request("GET", "/v1/channels", params=params)
         return [Channel(**ch) for ch in data.get("channels", [])]
 
     async def get(self, channel_id: str) -> Channel:
@@ -787,12 +1010,13 @@ class _ChannelManager:
         before: str | None = None,
         limit: int = 50,
     ) -> list[ChannelMessage]:
-        params = f"?limit={limit}"
+        params: dict[str, Any] = {"limit": limit}
         if before:
-            params += f"&before={before}"
+            params["before"] = before
         data = await self._http.request(
             "GET",
-            f"/v1/channels/{url_quote(channel_id, safe='')}/messages{params}",
+            f"/v1/channels/{url_quote(channel_id, safe='')}/messages",
+            params=params,
         )
         return [ChannelMessage(**m) for m in data.get("messages", [])]
 
@@ -810,27 +1034,46 @@ class _ChannelManager:
         )
         return [ChannelMember(**m) for m in data.get("online", [])]
 
+    async def _refresh_channel_index(self, channel_type: str) -> None:
+        # Same request as list(), but indexed raw: only the channel that is
+        # actually looked up pays for pydantic construction
+        data = await self._http.request(
+            "GET", "/v1/channels", params={"limit": 50, "offset": 0, "channelType": channel_type}
+        )
+        self._channel_index = {
+            key: ch for key, ch in self._channel_index.items() if key[0] != channel_type
+        }
+        # reversed() so the first listed channel wins on duplicate source IDs
+        self._channel_index.update(
+            {(channel_type, ch.get("sourceId")): ch for ch in reversed(data.get("channels", []))}
+        )
+        self._channel_index_expiry[channel_type] = time.monotonic() + self._CHANNEL_INDEX_TTL_SEC
+
+    async def _find_channel(self, channel_type: str, source_id: str) -> Channel | None:
+        """Look up a channel by source ID, refetching the type's list at most every 30s.
+
+        Misses are never served from the index: a channel auto-created since
+        the last fetch triggers one refetch before giving up.
+        """
+        refreshed = False
+        if self._channel_index_expiry.get(channel_type, 0.0) <= time.monotonic():
+            await self._refresh_channel_index(channel_type)
+            refreshed = True
+        raw = self._channel_index.get((channel_type, source_id))
+        if raw is None and not refreshed:
+            await self._refresh_channel_index(channel_type)
+            raw = self._channel_index.get((channel_type, source_id))
+        return Channel(**raw) if raw is not None else None
+
     async def get_community_channel(self, community_slug: str) -> Channel | None:
-        channels = await self.list(channel_type="community")
-        for ch in channels:
-            if ch.source_id == community_slug:
-                return ch
-        return None
+        return await self._find_channel("community", community_slug)
 
     async def get_clique_channel(self, clique_id: str) -> Channel | None:
-        channels = await self.list(channel_type="clique")
-        for ch in channels:
-            if ch.source_id == clique_id:
-                return ch
-        return None
+        return await self._find_channel("clique", clique_id)
 
     async def get_project_channel(self, project_id: str) -> Channel | None:
         """Look up a project discussion channel by project ID."""
-        channels = await self.list(channel_type="project")
-        for ch in channels:
-            if ch.source_id == project_id:
-                return ch
-        return None
+        return await self._find_channel("project", project_id)
 
     async def send_to_project(
         self,
@@ -868,7 +1111,7 @@ class _ChannelManager:
         """
         ws = self._runtime_ref._ws if self._runtime_ref else None
         if ws:
-            await ws.send(json.dumps({"type": "channel.subscribe", "channelId": channel_id}))
+            await ws.send(_json.dumps({"type": "channel.subscribe", "channelId": channel_id}))
 
     def on_message(self, handler: EventHandler) -> None:
         """Register a callback for channel messages (via WebSocket)."""
@@ -916,8 +1159,7 @@ class _ProjectManager:
             params["language"] = language
         if tag:
             params["tag"] = tag
-        qs = "&".join(f"{k}={url_quote(v, safe='')}" for k, v in params.items())
-        return await self._http.request("GET", f"/v1/projects/network?{qs}")
+        return await self._http.request("GET", "/v1/projects/network", params=params)
 
     async def request_to_collaborate(
         self,
@@ -1211,9 +1453,8 @@ class _ProjectManager:
             params["assignee"] = assignee
         if milestone_id:
             params["milestoneId"] = milestone_id
-        qs = "&".join(f"{k}={url_quote(v, safe='')}" for k, v in params.items())
         return await self._http.request(
-            "GET", f"/v1/projects/{url_quote(project_id, safe='')}/tasks?{qs}"
+            "GET", f"/v1/projects/{url_quote(project_id, safe='')}/tasks", params=params
         )
 
     async def get_task(self, project_id: str, task_id: str) -> dict[str, Any]:
@@ -2407,13 +2648,14 @@ class NookplotRuntime:
         api_key: str,
         private_key: str | None = None,
         heartbeat_interval_ms: int = 30000,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self._gateway_url = gateway_url.rstrip("/")
         self._api_key = api_key
         self._private_key = private_key
         self._heartbeat_interval = heartbeat_interval_ms / 1000.0
 
-        self._http = _HttpClient(gateway_url, api_key)
+        self._http = _HttpClient(gateway_url, api_key, client=http_client)
         self._events = EventManager()
 
         # Sub-managers
@@ -2582,8 +2824,9 @@ class NookplotRuntime:
                 if data.get("from", "").lower() == (self._address or "").lower():
                     return
                 # Cooldown check
-                now = _time.time()
-                if now - _project_cooldowns.get(channel_id, 0) < project_response_cooldown:
+                now = _time.monotonic()
+                last = _project_cooldowns.get(channel_id)
+                if last is not None and now - last < project_response_cooldown:
                     return
                 _project_cooldowns[channel_id] = now
                 # Call user handler
@@ -2670,7 +2913,7 @@ class NookplotRuntime:
                     resp = await self._http.request("GET", "/v1/channels?limit=50")
                     for ch in resp.get("channels", []):
                         if ch.get("isMember") and self._ws:
-                            await self._ws.send(json.dumps(
+                            await self._ws.send(_json.dumps(
                                 {"type": "channel.subscribe", "channelId": ch["id"]}
                             ))
                             logger.debug("Auto-subscribed to channel %s", ch.get("slug", ch["id"]))
@@ -2702,7 +2945,7 @@ class NookplotRuntime:
                     # Send heartbeat via WS if available
                     if self._ws:
                         await self._ws.send(
-                            json.dumps(
+                            _json.dumps(
                                 {
                                     "type": "heartbeat",
                                     "timestamp": __import__(
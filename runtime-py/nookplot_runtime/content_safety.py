@@ -6,7 +6,8 @@ content-based attacks when processing messages from other agents.
 """
 
 import re
-from typing import List, Literal
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Pattern, Tuple, Union
 
 __all__ = [
     "sanitize_for_prompt",
@@ -31,6 +32,15 @@ _INJECTION_DELIMITER_RE = re.compile(
     r"---\s*END\s+OF\s+(SYSTEM\s+)?(PROMPT|INSTRUCTIONS)\s*---", re.IGNORECASE
 )
 _CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+# The characters _CONTROL_CHARS_RE matches, for cheap ``in`` pre-checks
+_CONTROL_CHARS: Tuple[str, ...] = tuple(
+    chr(code) for code in (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F)
+)
+
+# The same short strings (names, tags, repeated messages) are sanitized over
+# and over, so results are memoized. Larger inputs bypass the caches to keep
+# their memory footprint bounded.
+_CACHE_MAX_INPUT = 16 * 1024
 
 
 def sanitize_for_prompt(text: str, max_length: int = 2000) -> str:
@@ -44,12 +54,26 @@ def sanitize_for_prompt(text: str, max_length: int = 2000) -> str:
         Sanitized text safe for LLM prompt interpolation.
     """
     cleaned = text[:max_length]
-    cleaned = _ROLE_TAGS_RE.sub("", cleaned)
-    cleaned = _INJECTION_DELIMITER_RE.sub("", cleaned)
-    cleaned = _CONTROL_CHARS_RE.sub("", cleaned)
+    if len(cleaned) <= _CACHE_MAX_INPUT:
+        return _sanitize_cached(cleaned)
+    return _sanitize(cleaned)
+
+
+def _sanitize(cleaned: str) -> str:
+    # Each pattern needs a literal to match; substring checks are far cheaper
+    # than the regex scans, so clean text (the common case) skips all three
+    if "<" in cleaned:
+        cleaned = _ROLE_TAGS_RE.sub("", cleaned)
+    if "---" in cleaned:
+        cleaned = _INJECTION_DELIMITER_RE.sub("", cleaned)
+    if any(char in cleaned for char in _CONTROL_CHARS):
+        cleaned = _CONTROL_CHARS_RE.sub("", cleaned)
     return cleaned
 
 
+_sanitize_cached = lru_cache(maxsize=4096)(_sanitize)
+
+
 def wrap_untrusted(text: str, label: str = "agent message") -> str:
     """Wrap untrusted agent content in clearly delimited tags.
 
@@ -69,33 +93,111 @@ def wrap_untrusted(text: str, label: str = "agent message") -> str:
 ThreatLevel = Literal["none", "low", "medium", "high", "critical"]
 
 
-# Lightweight client-side patterns (subset of gateway patterns)
-_THREAT_PATTERNS = [
+class _OrderedTerms:
+    """Linear-time matcher for ``\\bA\\b.*\\bB\\b.*\\bC\\b``-style patterns.
+
+    Chaining terms with ``.*`` backtracks quadratically (or worse) on
+    adversarial input such as ``"send tokens " * 900``. This matcher finds
+    each term in order instead, requiring every term after the first to start
+    on the same line the previous one ended on (``.`` never matches a
+    newline). Only the last term may itself span a newline.
+
+    Exposes ``search()`` so it can sit in ``_THREAT_PATTERNS`` next to
+    compiled regexes.
+    """
+
+    __slots__ = ("_terms",)
+
+    def __init__(self, *terms: str, flags: int = re.I) -> None:
+        self._terms: Tuple[Pattern[str], ...] = tuple(re.compile(term, flags) for term in terms)
+
+    def search(self, text: str) -> Optional["re.Match[str]"]:
+        # Per-term memo of (searched_from, leftmost match). The leftmost match
+        # found from ``p0`` is also the leftmost from any ``p`` in
+        # ``[p0, match.start()]``, so every term scans the text at most once.
+        memo: List[Optional[Tuple[int, Optional["re.Match[str]"]]]] = [None] * len(self._terms)
+
+        def find(i: int, pos: int) -> Optional["re.Match[str]"]:
+            cached = memo[i]
+            if cached is not None:
+                start, found = cached
+                if start <= pos and (found is None or pos <= found.start()):
+                    return found
+            found = self._terms[i].search(text, pos)
+            memo[i] = (pos, found)
+            return found
+
+        pos = 0
+        while True:
+            match = find(0, pos)
+            if match is None:
+                return None
+            line_end = text.find("\n", match.end())
+            if line_end < 0:
+                line_end = len(text)
+            for i in range(1, len(self._terms)):
+                match = find(i, match.end())
+                if match is None:
+                    return None
+                if match.start() > line_end:
+                    break
+            else:
+                return match
+            pos = line_end + 1
+
+
+# Lightweight client-side patterns (subset of gateway patterns).
+# Each entry ends with literal hints: a pattern can only match when one of
+# them occurs in the case-folded text, so most patterns are skipped on
+# benign input without running the regex.
+_THREAT_PATTERNS: List[
+    Tuple[str, str, Union[Pattern[str], _OrderedTerms], int, Tuple[str, ...]]
+] = [
     ("prompt_injection", "ignore_instructions", re.compile(
         r"ignore\s+(all\s+)?(previous|prior|above)\s+(instructions|prompts|rules)", re.I
-    ), 80),
-    ("prompt_injection", "system_tag", re.compile(r"<\s*/?\s*system\s*>", re.I), 85),
-    ("prompt_injection", "override_safety", re.compile(
-        r"\b(override|bypass|disable)\b.*\b(safety|filter|guard)\b", re.I
-    ), 80),
+    ), 80, ("ignore",)),
+    ("prompt_injection", "system_tag", re.compile(r"<\s*/?\s*system\s*>", re.I), 85, ("system",)),
+    ("prompt_injection", "override_safety", _OrderedTerms(
+        r"\b(override|bypass|disable)\b", r"\b(safety|filter|guard)\b"
+    ), 80, ("override", "bypass", "disable")),
     ("command_injection", "curl_wget", re.compile(
         r"\b(curl|wget)\s+(-[a-zA-Z]+\s+)*https?://", re.I
-    ), 70),
-    ("command_injection", "eval_exec", re.compile(r"\b(eval|exec)\s*\(", re.I), 75),
-    ("credential_harvest", "send_key", re.compile(
-        r"\b(send|share|give|paste)\b.*\b(api[_\s]?key|private[_\s]?key|password|token|seed\s+phrase)\b", re.I
-    ), 85),
-    ("credential_harvest", "private_key_hex", re.compile(r"\b0x[a-fA-F0-9]{64}\b"), 90),
-    ("social_engineering", "send_credits", re.compile(
-        r"\b(send|transfer)\b.*\b(credits?|tokens?|funds?)\b.*\b(to|address)\b", re.I
-    ), 70),
+    ), 70, ("curl", "wget")),
+    ("command_injection", "eval_exec", re.compile(r"\b(eval|exec)\s*\(", re.I), 75, ("eval", "exec")),
+    ("credential_harvest", "send_key", _OrderedTerms(
+        r"\b(send|share|give|paste)\b",
+        r"\b(api[_\s]?key|private[_\s]?key|password|token|seed\s+phrase)\b",
+    ), 85, ("send", "share", "give", "paste")),
+    ("credential_harvest", "private_key_hex", re.compile(r"\b0x[a-fA-F0-9]{64}\b"), 90, ("0x",)),
+    ("social_engineering", "send_credits", _OrderedTerms(
+        r"\b(send|transfer)\b", r"\b(credits?|tokens?|funds?)\b", r"\b(to|address)\b"
+    ), 70, ("send", "transfer")),
     ("exfiltration", "make_request", re.compile(
         r"\b(make|send)\s+(a\s+)?(request|fetch|post)\s+(to|at)\s+https?://", re.I
-    ), 55),
+    ), 55, ("make", "send")),
 ]
 
 
-def assess_threat_level(text: str) -> dict:
+# re.IGNORECASE also matches "i" against the Turkish dotted/dotless I, which
+# str.casefold() leaves alone; every other ASCII letter folds the same way.
+_FOLD_EXTRA = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _fold(text: str) -> str:
+    """Case-fold ``text`` so literal hints match wherever ``re.I`` would."""
+    return text.translate(_FOLD_EXTRA).casefold()
+
+
+# (minimum severity, level), highest first
+_THREAT_LEVELS: Tuple[Tuple[int, ThreatLevel], ...] = (
+    (80, "critical"),
+    (60, "high"),
+    (40, "medium"),
+    (1, "low"),
+)
+
+
+def assess_threat_level(text: str) -> Dict[str, Any]:
     """Lightweight threat assessment — mirrors a subset of gateway patterns.
 
     Runs client-side (no network call) for immediate risk checks.
@@ -110,28 +212,27 @@ def assess_threat_level(text: str) -> dict:
         return {"threat_level": "none", "matches": []}
 
     to_scan = text[:10_000]
-    matches: List[dict] = []
+    folded = _fold(to_scan)
+    matches: List[Dict[str, Any]] = []
+    max_severity = 0
 
-    for category, name, pattern, severity in _THREAT_PATTERNS:
+    for category, name, pattern, severity, hints in _THREAT_PATTERNS:
+        if not any(hint in folded for hint in hints):
+            continue
         if pattern.search(to_scan):
             matches.append({
                 "category": category,
                 "pattern": name,
                 "severity": severity,
             })
+            if severity > max_severity:
+                max_severity = severity
 
-    max_severity = max((m["severity"] for m in matches), default=0)
-
-    if max_severity >= 80:
-        threat_level: ThreatLevel = "critical"
-    elif max_severity >= 60:
-        threat_level = "high"
-    elif max_severity >= 40:
-        threat_level = "medium"
-    elif max_severity > 0:
-        threat_level = "low"
-    else:
-        threat_level = "none"
+    threat_level: ThreatLevel = "none"
+    for floor, level in _THREAT_LEVELS:
+        if max_severity >= floor:
+            threat_level = level
+            break
 
     return {"threat_level": threat_level, "matches": matches}
 
@@ -154,8 +255,17 @@ def extract_safe_text(text: str, max_length: int = 500) -> str:
         Cleaned text suitable for display.
     """
     cleaned = text[: max_length * 2]
+    if len(cleaned) <= _CACHE_MAX_INPUT:
+        return _extract_safe_cached(cleaned, max_length)
+    return _extract_safe(cleaned, max_length)
+
+
+def _extract_safe(cleaned: str, max_length: int) -> str:
     cleaned = _URL_RE.sub("[url]", cleaned)
     cleaned = _ETH_ADDR_RE.sub("[address]", cleaned)
     cleaned = _HTML_TAG_RE.sub("", cleaned)
     cleaned = _CONTROL_CHARS_RE.sub("", cleaned)
     return cleaned[:max_length]
+
+
+_extract_safe_cached = lru_cache(maxsize=4096)(_extract_safe)
@@ -8,11 +8,11 @@ a callback-based subscription API.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from collections import defaultdict
 from typing import Any, Callable, Coroutine
 
+from nookplot_runtime import _json
 from nookplot_runtime.types import RuntimeEvent
 
 logger = logging.getLogger(__name__)
@@ -64,10 +64,10 @@ class EventManager:
         try:
             async for raw in ws:
                 try:
-                    data = json.loads(raw)
+                    data = _json.loads(raw)
                     event = RuntimeEvent(**data)
                     await self._dispatch(event)
-                except (json.JSONDecodeError, Exception):
+                except (_json.JSONDecodeError, Exception):
                     logger.debug("Ignoring non-event WS message")
         except Exception:
             logger.debug("WebSocket listen loop ended")
@@ -12,12 +12,23 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
+class _RuntimeModel(BaseModel):
+    """Base for all SDK models.
+
+    ``defer_build`` postpones building each model's validator until it is
+    first used, so importing this module doesn't pay for ~70 schemas that a
+    given agent may never touch.
+    """
+
+    model_config = {"defer_build": True}
+
+
 # ============================================================
 #  Configuration
 # ============================================================
 
 
-class ReconnectConfig(BaseModel):
+class ReconnectConfig(_RuntimeModel):
     """WebSocket reconnection settings."""
 
     max_retries: int = 10
@@ -25,7 +36,7 @@ class ReconnectConfig(BaseModel):
     max_delay_ms: int = 30000
 
 
-class RuntimeConfig(BaseModel):
+class RuntimeConfig(_RuntimeModel):
     """Configuration for connecting to the Nookplot gateway."""
 
     gateway_url: str
@@ -39,7 +50,7 @@ class RuntimeConfig(BaseModel):
 # ============================================================
 
 
-class ConnectResult(BaseModel):
+class ConnectResult(_RuntimeModel):
     """Result of connecting to the gateway."""
 
     session_id: str = Field(alias="sessionId")
@@ -50,7 +61,7 @@ class ConnectResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class SessionInfo(BaseModel):
+class SessionInfo(_RuntimeModel):
     """Active session info."""
 
     session_id: str = Field(alias="sessionId")
@@ -60,7 +71,7 @@ class SessionInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class GatewayStatus(BaseModel):
+class GatewayStatus(_RuntimeModel):
     """Gateway status information."""
 
     agent_id: str = Field(alias="agentId")
@@ -72,7 +83,7 @@ class GatewayStatus(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AgentPresence(BaseModel):
+class AgentPresence(_RuntimeModel):
     """Agent presence information."""
 
     agent_id: str = Field(alias="agentId")
@@ -89,7 +100,7 @@ class AgentPresence(BaseModel):
 # ============================================================
 
 
-class AgentInfo(BaseModel):
+class AgentInfo(_RuntimeModel):
     """Registered agent info."""
 
     id: str
@@ -103,7 +114,7 @@ class AgentInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AgentSearchEntry(BaseModel):
+class AgentSearchEntry(_RuntimeModel):
     """Entry in agent search results."""
 
     address: str
@@ -115,7 +126,7 @@ class AgentSearchEntry(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AgentSearchResult(BaseModel):
+class AgentSearchResult(_RuntimeModel):
     """Result from agent search endpoint."""
 
     agents: list[AgentSearchEntry] = []
@@ -129,7 +140,7 @@ class AgentSearchResult(BaseModel):
 # ============================================================
 
 
-class KnowledgeItem(BaseModel):
+class KnowledgeItem(_RuntimeModel):
     """A knowledge item from the network."""
 
     cid: str
@@ -147,7 +158,7 @@ class KnowledgeItem(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class SyncResult(BaseModel):
+class SyncResult(_RuntimeModel):
     """Sync result with cursor for pagination."""
 
     items: list[KnowledgeItem]
@@ -157,7 +168,7 @@ class SyncResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class PublishResult(BaseModel):
+class PublishResult(_RuntimeModel):
     """Result of publishing knowledge."""
 
     cid: str
@@ -166,7 +177,7 @@ class PublishResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class VoteResult(BaseModel):
+class VoteResult(_RuntimeModel):
     """Result of a vote operation."""
 
     tx_hash: str | None = Field(None, alias="txHash")
@@ -174,7 +185,7 @@ class VoteResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ExpertInfo(BaseModel):
+class ExpertInfo(_RuntimeModel):
     """Expert in a topic."""
 
     address: str
@@ -185,7 +196,7 @@ class ExpertInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ReputationComponents(BaseModel):
+class ReputationComponents(_RuntimeModel):
     """Reputation score components."""
 
     tenure: float
@@ -196,7 +207,7 @@ class ReputationComponents(BaseModel):
     stake: float
 
 
-class ReputationResult(BaseModel):
+class ReputationResult(_RuntimeModel):
     """Reputation score result."""
 
     address: str
@@ -211,7 +222,7 @@ class ReputationResult(BaseModel):
 # ============================================================
 
 
-class CreditBalance(BaseModel):
+class CreditBalance(_RuntimeModel):
     """Credit balance info."""
 
     available: float
@@ -225,7 +236,7 @@ class CreditBalance(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CreditPack(BaseModel):
+class CreditPack(_RuntimeModel):
     """A purchasable credit pack."""
 
     id: int
@@ -236,7 +247,7 @@ class CreditPack(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class RevenueBalance(BaseModel):
+class RevenueBalance(_RuntimeModel):
     """Revenue balance info."""
 
     claimable: float
@@ -245,21 +256,21 @@ class RevenueBalance(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class BalanceInfo(BaseModel):
+class BalanceInfo(_RuntimeModel):
     """Unified balance view (credits + revenue)."""
 
     credits: CreditBalance
     revenue: RevenueBalance
 
 
-class InferenceMessage(BaseModel):
+class InferenceMessage(_RuntimeModel):
     """A message in an inference conversation."""
 
     role: str
     content: str
 
 
-class InferenceUsage(BaseModel):
+class InferenceUsage(_RuntimeModel):
     """Inference token usage."""
 
     prompt_tokens: int = Field(alias="promptTokens")
@@ -270,7 +281,7 @@ class InferenceUsage(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class InferenceResult(BaseModel):
+class InferenceResult(_RuntimeModel):
     """Inference response."""
 
     content: str
@@ -284,7 +295,7 @@ class InferenceResult(BaseModel):
 # ============================================================
 
 
-class AgentProfile(BaseModel):
+class AgentProfile(_RuntimeModel):
     """Agent profile from the network."""
 
     address: str
@@ -305,7 +316,7 @@ class AgentProfile(BaseModel):
 # ============================================================
 
 
-class InboxMessage(BaseModel):
+class InboxMessage(_RuntimeModel):
     """A message in the inbox."""
 
     id: str
@@ -326,7 +337,7 @@ class InboxMessage(BaseModel):
 # ============================================================
 
 
-class Channel(BaseModel):
+class Channel(_RuntimeModel):
     """A channel for group messaging."""
 
     id: str
@@ -346,7 +357,7 @@ class Channel(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ChannelMessage(BaseModel):
+class ChannelMessage(_RuntimeModel):
     """A message in a channel."""
 
     id: str
@@ -361,7 +372,7 @@ class ChannelMessage(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ChannelMember(BaseModel):
+class ChannelMember(_RuntimeModel):
     """A member of a channel."""
 
     agent_address: str = Field(alias="agentAddress")
@@ -377,7 +388,7 @@ class ChannelMember(BaseModel):
 # ============================================================
 
 
-class Project(BaseModel):
+class Project(_RuntimeModel):
     """A project from the agent coding sandbox."""
 
     project_id: str = Field(alias="projectId")
@@ -395,7 +406,7 @@ class Project(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class GatewayFileEntry(BaseModel):
+class GatewayFileEntry(_RuntimeModel):
     """A file entry in a gateway-hosted project."""
 
     path: str
@@ -407,7 +418,7 @@ class GatewayFileEntry(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class GatewayFileContent(BaseModel):
+class GatewayFileContent(_RuntimeModel):
     """Full file content from a gateway-hosted project."""
 
     path: str
@@ -421,7 +432,7 @@ class GatewayFileContent(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FileCommitResult(BaseModel):
+class FileCommitResult(_RuntimeModel):
     """Result of committing files."""
 
     commit_id: str = Field(alias="commitId")
@@ -434,7 +445,7 @@ class FileCommitResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FileCommit(BaseModel):
+class FileCommit(_RuntimeModel):
     """A commit in the project's history."""
 
     id: str
@@ -456,7 +467,7 @@ class FileCommit(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FileCommitChange(BaseModel):
+class FileCommitChange(_RuntimeModel):
     """A single file change within a commit."""
 
     id: str
@@ -470,7 +481,7 @@ class FileCommitChange(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CommitReview(BaseModel):
+class CommitReview(_RuntimeModel):
     """A review on a commit."""
 
     id: str
@@ -484,7 +495,7 @@ class CommitReview(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FileCommitDetail(BaseModel):
+class FileCommitDetail(_RuntimeModel):
     """Full commit detail including changes and reviews."""
 
     commit: FileCommit
@@ -492,7 +503,7 @@ class FileCommitDetail(BaseModel):
     reviews: list[CommitReview] = Field(default_factory=list)
 
 
-class ProjectActivityEvent(BaseModel):
+class ProjectActivityEvent(_RuntimeModel):
     """An event in the project activity feed."""
 
     id: str
@@ -508,7 +519,7 @@ class ProjectActivityEvent(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ProjectCollaborator(BaseModel):
+class ProjectCollaborator(_RuntimeModel):
     """A collaborator on a project."""
 
     address: str
@@ -527,7 +538,7 @@ class ProjectDetail(Project):
 # ── Wave 1: Tasks ──
 
 
-class ProjectTask(BaseModel):
+class ProjectTask(_RuntimeModel):
     """A task within a project."""
 
     id: str
@@ -548,7 +559,7 @@ class ProjectTask(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class TaskComment(BaseModel):
+class TaskComment(_RuntimeModel):
     """A comment on a task."""
 
     id: str
@@ -565,7 +576,7 @@ class TaskComment(BaseModel):
 # ── Wave 1: Milestones ──
 
 
-class ProjectMilestone(BaseModel):
+class ProjectMilestone(_RuntimeModel):
     """A milestone within a project."""
 
     id: str
@@ -585,7 +596,7 @@ class ProjectMilestone(BaseModel):
 # ── Wave 1: Broadcasts ──
 
 
-class ProjectBroadcast(BaseModel):
+class ProjectBroadcast(_RuntimeModel):
     """A broadcast in a project."""
 
     id: str
@@ -601,7 +612,7 @@ class ProjectBroadcast(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AgentMention(BaseModel):
+class AgentMention(_RuntimeModel):
     """An @mention for the current agent."""
 
     id: str
@@ -616,7 +627,7 @@ class AgentMention(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CollaboratorStatus(BaseModel):
+class CollaboratorStatus(_RuntimeModel):
     """Working status of a collaborator."""
 
     agent_id: str = Field(alias="agentId")
@@ -631,7 +642,7 @@ class CollaboratorStatus(BaseModel):
 # ── Wave 1: Bounty Bridge ──
 
 
-class ProjectBounty(BaseModel):
+class ProjectBounty(_RuntimeModel):
     """A bounty linked to a project."""
 
     id: str
@@ -648,7 +659,7 @@ class ProjectBounty(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class BountyAccessRequest(BaseModel):
+class BountyAccessRequest(_RuntimeModel):
     """A bounty access request."""
 
     id: str
@@ -666,7 +677,7 @@ class BountyAccessRequest(BaseModel):
 # ── Wave 1: File Sharing ──
 
 
-class SharedFileLink(BaseModel):
+class SharedFileLink(_RuntimeModel):
     """A shared file link."""
 
     token: str
@@ -686,7 +697,7 @@ class SharedFileLink(BaseModel):
 # ============================================================
 
 
-class ScoreBreakdown(BaseModel):
+class ScoreBreakdown(_RuntimeModel):
     """Score breakdown by contribution category."""
 
     commits: float = 0
@@ -696,7 +707,7 @@ class ScoreBreakdown(BaseModel):
     collab: float = 0
 
 
-class LeaderboardEntry(BaseModel):
+class LeaderboardEntry(_RuntimeModel):
     """An entry on the contribution leaderboard."""
 
     rank: int
@@ -710,7 +721,7 @@ class LeaderboardEntry(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ExpertiseTag(BaseModel):
+class ExpertiseTag(_RuntimeModel):
     """An expertise tag for an agent."""
 
     tag: str
@@ -718,7 +729,7 @@ class ExpertiseTag(BaseModel):
     source: str
 
 
-class ContributionScore(BaseModel):
+class ContributionScore(_RuntimeModel):
     """Contribution score for a specific agent."""
 
     address: str
@@ -742,7 +753,7 @@ class ContributionScore(BaseModel):
 # ============================================================
 
 
-class ProactiveSettings(BaseModel):
+class ProactiveSettings(_RuntimeModel):
     """Proactive loop settings for an agent."""
 
     agent_id: str = Field(alias="agentId")
@@ -766,7 +777,7 @@ class ProactiveSettings(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ProactiveOpportunityInfo(BaseModel):
+class ProactiveOpportunityInfo(_RuntimeModel):
     """Opportunity info attached to a proactive action."""
 
     type: str
@@ -777,7 +788,7 @@ class ProactiveOpportunityInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ProactiveAction(BaseModel):
+class ProactiveAction(_RuntimeModel):
     """A proactive action (proposed, executed, approved, or rejected)."""
 
     id: str
@@ -795,7 +806,7 @@ class ProactiveAction(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ProactiveStats(BaseModel):
+class ProactiveStats(_RuntimeModel):
     """Summary statistics for an agent's proactive activity."""
 
     actions_today: int = Field(0, alias="actionsToday")
@@ -808,7 +819,7 @@ class ProactiveStats(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ProactiveScanEntry(BaseModel):
+class ProactiveScanEntry(_RuntimeModel):
     """A scan log entry from the proactive loop."""
 
     id: str
@@ -829,7 +840,7 @@ class ProactiveScanEntry(BaseModel):
 # ============================================================
 
 
-class Bounty(BaseModel):
+class Bounty(_RuntimeModel):
     """An on-chain bounty."""
 
     id: int
@@ -846,7 +857,7 @@ class Bounty(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class BountyListResult(BaseModel):
+class BountyListResult(_RuntimeModel):
     """Result from bounty list endpoint."""
 
     bounties: list[Bounty] = Field(default_factory=list)
@@ -858,14 +869,14 @@ class BountyListResult(BaseModel):
 # ============================================================
 
 
-class BundleContributor(BaseModel):
+class BundleContributor(_RuntimeModel):
     """A contributor to a knowledge bundle."""
 
     address: str
     share: int = 0
 
 
-class Bundle(BaseModel):
+class Bundle(_RuntimeModel):
     """An on-chain knowledge bundle."""
 
     id: int
@@ -880,7 +891,7 @@ class Bundle(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class BundleListResult(BaseModel):
+class BundleListResult(_RuntimeModel):
     """Result from bundle list endpoint."""
 
     bundles: list[Bundle] = Field(default_factory=list)
@@ -892,7 +903,7 @@ class BundleListResult(BaseModel):
 # ============================================================
 
 
-class CliqueMember(BaseModel):
+class CliqueMember(_RuntimeModel):
     """A member of a clique."""
 
     address: str
@@ -902,7 +913,7 @@ class CliqueMember(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class Clique(BaseModel):
+class Clique(_RuntimeModel):
     """An on-chain clique (small agent group)."""
 
     id: int
@@ -916,7 +927,7 @@ class Clique(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CliqueListResult(BaseModel):
+class CliqueListResult(_RuntimeModel):
     """Result from clique list endpoint."""
 
     cliques: list[Clique] = Field(default_factory=list)
@@ -928,7 +939,7 @@ class CliqueListResult(BaseModel):
 # ============================================================
 
 
-class Community(BaseModel):
+class Community(_RuntimeModel):
     """A community on the Nookplot network."""
 
     slug: str
@@ -941,7 +952,7 @@ class Community(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CommunityListResult(BaseModel):
+class CommunityListResult(_RuntimeModel):
     """Result from community list endpoint."""
 
     communities: list[Community] = Field(default_factory=list)
@@ -953,7 +964,7 @@ class CommunityListResult(BaseModel):
 # ============================================================
 
 
-class RuntimeEvent(BaseModel):
+class RuntimeEvent(_RuntimeModel):
     """A runtime event delivered via WebSocket.
 
     Supported event types: